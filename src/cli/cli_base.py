@@ -165,12 +165,11 @@ class CliBase(ABC):
             return int(arg)  # try convert to int
         except ValueError:
             pass
-        uc_arg = str(arg).upper()
-        if uc_arg in TMCC2_SPEED_MAP:
-            # feels a little hacky, but need a way to use a different map for TMCC commands
-            if '-tmcc' in sys.argv or '-tmcc1' in sys.argv:
-                return TMCC1_SPEED_MAP[uc_arg]
-            return TMCC2_SPEED_MAP[uc_arg]
+        # feels a little hacky, but need a way to use a different map for TMCC commands
+        speed_map = TMCC1_SPEED_MAP if '-tmcc' in sys.argv or '-tmcc1' in sys.argv else TMCC2_SPEED_MAP
+        speed = speed_map.get(str(arg).upper())
+        if speed is not None:
+            return speed
         raise argparse.ArgumentTypeError("Speed must be between 0 and 199 (0 and 31, for tmcc)")
 
     @staticmethod
@@ -14,6 +14,7 @@ from src.protocol.tmcc2.param_constants import TMCC2ParameterEnum, TMCC2RailSoun
 from src.protocol.tmcc2.param_constants import TMCC2EffectsControl, TMCC2LightingControl
 from src.protocol.tmcc2.param_constants import TMCC2RailSoundsEffectsControl
 
+from src.protocol.constants import CommandSyntax
 from src.protocol.sequence.sequence_constants import SequenceCommandEnum
 
 from src.utils.argument_parser import ArgumentParser
@@ -25,6 +26,11 @@ AUX_COMMAND_MAP = {
     "opt2": "_OPTION_TWO",
 }
 
+ENGINE_CMD_MAP = {
+    CommandSyntax.TMCC: EngineCmdTMCC1,
+    CommandSyntax.LEGACY: EngineCmdTMCC2,
+}
+
 
 class EngineCli(CliBaseTMCC):
     @classmethod
@@ -463,29 +469,21 @@ class EngineCli(CliBaseTMCC):
                  do_fire: bool = True) -> None:
         super().__init__(arg_parser, cmd_line, do_fire)
         engine: int = self._args.engine
-        option_data: int = self._args.data if 'data' in self._args else 0
+        option_data: int = getattr(self._args, 'data', 0)
         try:
             option = self._decode_engine_option()  # raise ValueError if can't decode
             if option is None:
                 raise ValueError("Must specify an option, use -h for help")
             # print(self._args)
             scope = self._determine_scope()
-            if self.is_tmcc2 or option.is_tmcc2:
-                cmd = EngineCmdTMCC2(engine,
-                                     option,
-                                     option_data,
-                                     scope,
-                                     baudrate=self._baudrate,
-                                     port=self._port,
-                                     server=self._server)
-            else:
-                cmd = EngineCmdTMCC1(engine,
-                                     TMCC1EngineCommandDef(option),
-                                     option_data,
-                                     scope,
-                                     baudrate=self._baudrate,
-                                     port=self._port,
-                                     server=self._server)
+            # the decoded option's syntax determines the command class
+            cmd = ENGINE_CMD_MAP[option.syntax](engine,
+                                                option,
+                                                option_data,
+                                                scope,
+                                                baudrate=self._baudrate,
+                                                port=self._port,
+                                                server=self._server)
             if self.do_fire:
                 cmd.fire(repeat=self._args.repeat, delay=self._args.delay)
             self._command = cmd
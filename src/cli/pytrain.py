@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import os
 import readline
+import sys
 
 from datetime import datetime
 from typing import List
@@ -62,7 +63,7 @@ class PyTrain:
             # listen for client connections, unless user used --no_clients flag
             if not self._args.no_clients:
                 print(f"Listening for client broadcasts on port {self._args.server_port}...")
-                self._receiver = EnqueueProxyRequests(self.buffer, self._args.server_port)
+                self._receiver = EnqueueProxyRequests.build(self.buffer, self._args.server_port)
                 self._tmcc_listener = CommandListener.build()
                 listeners.append(self._tmcc_listener)
             if self._base3_addr is not None:
@@ -87,6 +88,10 @@ class PyTrain:
             self._state_store.listen_for(CommandScope.SWITCH)
             self._state_store.listen_for(CommandScope.ACC)
 
+        # build the command dispatch parser once; it is reused for every input line
+        self._cmd_parser = self._command_parser()
+        self._cli_parsers: dict[type, ArgumentParser] = {}  # per-command parsers, built on first use
+
         # Start the command line processor
         self.run()
 
@@ -112,6 +117,11 @@ class PyTrain:
     def run(self) -> None:
         # process startup script
         self._process_startup_scripts()
+        # if commands are piped in, process them all, then exit
+        if not sys.stdin.isatty():
+            self._process_batch(sys.stdin.read().splitlines())
+            self._shutdown()
+            return
         # print opening line
         print(f"{PROGRAM_NAME}, Ver 0.1")
         while True:
@@ -124,28 +134,47 @@ class PyTrain:
             except argparse.ArgumentError:
                 pass
             except KeyboardInterrupt:
-                try:
-                    CommBuffer.stop()
-                except Exception as e:
-                    print(f"Error closing command buffer, continuing shutdown: {e}")
-                try:
-                    CommandListener.stop()
-                except Exception as e:
-                    print(f"Error closing TMCC listener, continuing shutdown: {e}")
-                try:
-                    PdiListener.stop()
-                except Exception as e:
-                    print(f"Error closing PDI listener, continuing shutdown: {e}")
-                try:
-                    ComponentStateStore.reset()
-                except Exception as e:
-                    print(f"Error resetting state store, continuing shutdown: {e}")
-                try:
-                    GpioHandler.reset_all()
-                except Exception as e:
-                    print(f"Error releasing GPIO, continuing shutdown: {e}")
+                self._shutdown()
                 break
 
+    def _process_batch(self, lines: List[str]) -> None:
+        """
+            Process a batch of commands, such as those read from a file or pipe. There
+            is no need to prompt for, or record the history of, each line.
+        """
+        for ui in lines:
+            try:
+                self._handle_command(ui)
+            except SystemExit:
+                pass
+            except argparse.ArgumentError:
+                pass
+            except KeyboardInterrupt:
+                break  # user issued 'quit'; ignore remaining commands
+
+    @staticmethod
+    def _shutdown() -> None:
+        try:
+            CommBuffer.stop()
+        except Exception as e:
+            print(f"Error closing command buffer, continuing shutdown: {e}")
+        try:
+            CommandListener.stop()
+        except Exception as e:
+            print(f"Error closing TMCC listener, continuing shutdown: {e}")
+        try:
+            PdiListener.stop()
+        except Exception as e:
+            print(f"Error closing PDI listener, continuing shutdown: {e}")
+        try:
+            ComponentStateStore.reset()
+        except Exception as e:
+            print(f"Error resetting state store, continuing shutdown: {e}")
+        try:
+            GpioHandler.reset_all()
+        except Exception as e:
+            print(f"Error releasing GPIO, continuing shutdown: {e}")
+
     def _handle_command(self, ui: str) -> None:
         """
             Parse the user's input, reusing the individual CLI command parsers.
@@ -158,36 +187,48 @@ class PyTrain:
             # show help, if user enters '?'
             if ui == '?':
                 ui = 'h'
-            # the argparse library requires the argument string to be presented as a list
-            ui_parts = ui.split()
-            if ui_parts[0]:
+            # peel off the command verb; the remainder is only tokenized if needed
+            verb, *tail = ui.split(None, 1)
+            rest = tail[0] if tail else ''
+            if verb:
                 # parse the first token
                 try:
                     # if the keyboard input starts with a valid command, args.command
                     # is set to the corresponding CLI command class, or the verb 'quit'
-                    args = self._command_parser().parse_args(['-' + ui_parts[0]])
+                    args = self._cmd_parser.parse_args(['-' + verb])
                     if args.command == 'quit':
                         raise KeyboardInterrupt()
                     elif args.command == 'help':
-                        self._command_parser().parse_args(["-help"])
+                        self._cmd_parser.parse_args(["-help"])
                     if args.command == 'db':
-                        self._query_status(ui_parts[1:])
+                        self._query_status(rest.split())
                         return
                     if args.command == 'pdi':
-                        self._do_pdi(ui_parts[1:])
+                        self._do_pdi(rest.split())
                         return
                     if args.command == 'echo':
-                        self._handle_echo(ui_parts)
+                        self._handle_echo([verb] + rest.split())
                         return
-                    ui_parser = args.command.command_parser()
-                    ui_parser.remove_args(['baudrate', 'port', 'server'])
-                    cli_cmd = args.command(ui_parser, ui_parts[1:], False)
+                    # the argparse library requires the argument string to be presented as a list
+                    cli_cmd = args.command(self._cli_parser(args.command), rest.split(), False)
                     if cli_cmd.command is None:
                         raise argparse.ArgumentError(None, f"'{ui}' is not a valid command")
                     cli_cmd.send()
                 except argparse.ArgumentError as e:
                     print(f"{e}")
 
+    def _cli_parser(self, cli_class: type) -> ArgumentParser:
+        """
+            Return the argument parser for the given CLI command class, building and
+            caching it the first time the command is used
+        """
+        ui_parser = self._cli_parsers.get(cli_class)
+        if ui_parser is None:
+            ui_parser = cli_class.command_parser()
+            ui_parser.remove_args(['baudrate', 'port', 'server'])
+            self._cli_parsers[cli_class] = ui_parser
+        return ui_parser
+
     def _process_startup_scripts(self) -> None:
         if self._startup_script is not None:
             if os.path.isfile(self._startup_script):
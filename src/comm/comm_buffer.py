@@ -247,12 +247,12 @@ class CommBufferProxy(CommBuffer):
                 _ = s.recv(16)  # we don't care about the response
 
     def register(self) -> None:
-        from src.comm.enqueue_proxy_requests import EnqueueProxyRequests
+        from src.comm.enqueue_proxy_requests import REGISTER_REQUEST
         retries = 0
         while True:
             try:
                 # noinspection PyTypeChecker
-                self.enqueue_command(EnqueueProxyRequests.register_request)
+                self.enqueue_command(REGISTER_REQUEST)
                 return
             except ConnectionError as ce:
                 # give server time to boot up:
@@ -265,10 +265,10 @@ class CommBufferProxy(CommBuffer):
                     raise ce
 
     def sync_state(self) -> None:
-        from src.comm.enqueue_proxy_requests import EnqueueProxyRequests
+        from src.comm.enqueue_proxy_requests import SYNC_STATE_REQUEST
         try:
             # noinspection PyTypeChecker
-            self.enqueue_command(EnqueueProxyRequests.sync_state_request)
+            self.enqueue_command(SYNC_STATE_REQUEST)
             return
         except ConnectionError as ce:
             raise ce
@@ -315,7 +315,7 @@ class CommandDispatcher(Thread):
         self._is_running = True
         self._queue = Queue[CommandReq](queue_size)
         self._broadcasts = False
-        self._client_port = EnqueueProxyRequests.port if EnqueueProxyRequests.is_built else None
+        self._client_port = EnqueueProxyRequests.port() if EnqueueProxyRequests.is_built() else None
         self.start()
 
     def run(self) -> None:
@@ -338,11 +338,16 @@ class CommandDispatcher(Thread):
                         self.publish_all(cmd, [CommandScope.ENGINE, CommandScope.TRAIN])
                     # otherwise, just send to the interested parties
                     else:
+                        # channels are keyed on tuples of the command's fields; read
+                        # each field once rather than once per channel
+                        scope = cmd.scope
+                        address = cmd.address
+                        command = cmd.command
                         if cmd.is_data is not None:
-                            self.publish((cmd.scope, cmd.address, cmd.command, cmd.data), cmd)
-                        self.publish((cmd.scope, cmd.address, cmd.command), cmd)
-                        self.publish((cmd.scope, cmd.address), cmd)
-                        self.publish(cmd.scope, cmd)
+                            self.publish((scope, address, command, cmd.data), cmd)
+                        self.publish((scope, address, command), cmd)
+                        self.publish((scope, address), cmd)
+                        self.publish(scope, cmd)
                     if self._broadcasts:
                         self.publish(BROADCAST_TOPIC, cmd)
                     # update state on all clients
@@ -359,13 +364,14 @@ class CommandDispatcher(Thread):
             client states in sync with server
         """
         if self._client_port is not None:
+            payload = command.as_bytes
             # noinspection PyTypeChecker
-            for client in EnqueueProxyRequests.clients:
+            for client in EnqueueProxyRequests.clients():
                 try:
                     with self._lock:
                         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                             s.connect((client, self._client_port))
-                            s.sendall(command.as_bytes)
+                            s.sendall(payload)
                             _ = s.recv(16)
                 except ConnectionRefusedError:
                     # ignore disconnects; client will receive state update on reconnect
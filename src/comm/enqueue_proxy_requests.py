@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import socket
 import socketserver
 import threading
 from threading import Thread
-from typing import List
+from typing import Tuple
 
 from ..comm.comm_buffer import CommBuffer
-from ..protocol.constants import DEFAULT_SERVER_PORT
+from ..protocol.constants import DEFAULT_SERVER_PORT, DEFAULT_RECV_SIZE
 
-REGISTER_REQUEST: bytes = int(0xff).to_bytes(1) * 6
-SYNC_STATE_REQUEST: bytes = int(0xfff0).to_bytes(2, byteorder='big') * 3
+REGISTER_REQUEST: bytes = b'\xff\xff\xff\xff\xff\xff'  # 0xff, six times
+SYNC_STATE_REQUEST: bytes = b'\xff\xf0\xff\xf0\xff\xf0'  # 0xfff0 (big endian), three times
 
 
 class EnqueueProxyRequests(Thread):
@@ -18,13 +19,15 @@ class EnqueueProxyRequests(Thread):
         dispatch to the LCS SER2.
     """
     _instance = None
-    _lock = threading.RLock()
+    _lock = threading.Lock()
 
     @classmethod
     def build(cls, buffer: CommBuffer, port: int = DEFAULT_SERVER_PORT) -> EnqueueProxyRequests:
         """
             Factory method to create a EnqueueProxyRequests instance
         """
+        if cls._instance is not None:
+            return cls._instance  # already built; skip __new__/__init__ entirely
         return EnqueueProxyRequests(buffer, port)
 
     @classmethod
@@ -38,7 +41,9 @@ class EnqueueProxyRequests(Thread):
         """
         if cls._instance is not None:
             # noinspection PyProtectedMember
-            cls._instance._clients.add(client)
+            with cls._instance._clients_lock:
+                # noinspection PyProtectedMember
+                cls._instance._clients.add(client)
 
     @classmethod
     def get_comm_buffer(cls) -> CommBuffer:
@@ -50,34 +55,30 @@ class EnqueueProxyRequests(Thread):
         if cls._instance is not None:
             cls._instance.shutdown()
 
-    # noinspection PyPropertyDefinition
-    @classmethod
-    @property
-    def register_request(cls) -> bytes:
-        return REGISTER_REQUEST
-
-    # noinspection PyPropertyDefinition
-    @classmethod
-    @property
-    def sync_state_request(cls) -> bytes:
-        return SYNC_STATE_REQUEST
-
-    # noinspection PyPropertyDefinition
     @classmethod
-    @property
     def is_built(cls) -> bool:
         return cls._instance is not None
 
-    # noinspection PyPropertyDefinition
     @classmethod
-    @property
-    def clients(cls) -> List[str]:
+    def clients(cls) -> Tuple[str, ...]:
+        """
+            Snapshot of the known client IPs, safe to iterate while clients register
+        """
+        instance = cls._instance  # read once; shutdown() may clear it concurrently
+        if instance is None:
+            return ()
+        # noinspection PyProtectedMember
+        with instance._clients_lock:
+            # noinspection PyProtectedMember
+            return tuple(instance._clients)
+
+    @classmethod
+    def has_client(cls, client: str) -> bool:
+        instance = cls._instance  # read once; shutdown() may clear it concurrently
         # noinspection PyProtectedMember
-        return list(cls._instance._clients)
+        return instance is not None and client in instance._clients
 
-    # noinspection PyPropertyDefinition
     @classmethod
-    @property
     def port(cls) -> int:
         if cls._instance is not None:
             # noinspection PyProtectedMember
@@ -88,14 +89,28 @@ class EnqueueProxyRequests(Thread):
                  tmcc_buffer: CommBuffer,
                  port: int = DEFAULT_SERVER_PORT
                  ) -> None:
-        if self._initialized:
-            return
-        else:
+        # check and set under the lock, so concurrent callers can't both start the thread
+        with self._lock:
+            if self._initialized:
+                return
             self._initialized = True
         super().__init__(daemon=True, name="PyLegacy Enqueue Receiver")
         self._tmcc_buffer: CommBuffer = tmcc_buffer
         self._port = port
         self._clients: set[str] = set()
+        self._clients_lock = threading.Lock()  # handler threads add clients concurrently
+        # bind now, so shutdown() always has the live server to stop, even if called
+        # before the thread gets going, and bind errors surface to the caller
+        try:
+            # noinspection PyTypeChecker
+            self._server = EnqueueServer(('', self._port), EnqueueHandler)
+        except OSError:
+            # don't leave a half-built singleton behind for build() to hand out
+            with self._lock:
+                self._initialized = False
+                if EnqueueProxyRequests._instance is self:
+                    EnqueueProxyRequests._instance = None
+            raise
         self.start()
 
     def __new__(cls, *args, **kwargs):
@@ -114,30 +129,42 @@ class EnqueueProxyRequests(Thread):
             Simplified TCP/IP Server listens for command requests from client and executes them
             on the PyTrain server.
         """
-        # noinspection PyTypeChecker
-        with socketserver.TCPServer(('', self._port), EnqueueHandler) as server:
+        with self._server as server:
             server.serve_forever()
 
     def shutdown(self) -> None:
-        # noinspection PyTypeChecker
-        with socketserver.TCPServer(('', self._port), EnqueueHandler) as server:
-            server.shutdown()
+        self._server.shutdown()  # returns once serve_forever exits; run() then closes the socket
+        with self._lock:
+            if EnqueueProxyRequests._instance is self:
+                EnqueueProxyRequests._instance = None
+
+
+class EnqueueServer(socketserver.ThreadingTCPServer):
+    """
+        Handle each client connection in its own thread, so one slow client
+        doesn't hold up the others. Allow quick restarts on the same port.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
 
 
 class EnqueueHandler(socketserver.BaseRequestHandler):
     def handle(self):
-        byte_stream = bytes()
+        # requests and acks are tiny; don't let Nagle hold them back
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        buffer = bytearray()
         while True:
-            data = self.request.recv(128)
+            data = self.request.recv(DEFAULT_RECV_SIZE)
             if data:
-                byte_stream += data
+                buffer.extend(data)
                 self.request.sendall(str.encode("ack"))
             else:
                 break
+        byte_stream = bytes(buffer)
         EnqueueProxyRequests.note_client_addr(self.client_address[0])
-        if byte_stream == EnqueueProxyRequests.register_request:
+        if byte_stream == REGISTER_REQUEST:
             pass
-        elif byte_stream == EnqueueProxyRequests.sync_state_request:
+        elif byte_stream == SYNC_STATE_REQUEST:
             from ..comm.command_listener import CommandDispatcher
             CommandDispatcher.build().send_current_state(self.client_address[0])
         else:
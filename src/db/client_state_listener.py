@@ -8,6 +8,7 @@ from ..comm.command_listener import CommandListener, Subscriber, Topic
 from ..pdi.constants import PDI_SOP
 from ..pdi.pdi_listener import PdiListener
 from ..protocol.command_def import CommandDefEnum
+from ..protocol.constants import DEFAULT_RECV_SIZE
 
 
 class ClientStateListener(threading.Thread):
@@ -85,12 +86,13 @@ class ClientStateListener(threading.Thread):
 
 class ClientStateHandler(socketserver.BaseRequestHandler):
     def handle(self):
-        byte_stream = bytes()
+        buffer = bytearray()
         while True:
-            data = self.request.recv(128)
+            data = self.request.recv(DEFAULT_RECV_SIZE)
             if data:
-                byte_stream += data
+                buffer.extend(data)
                 self.request.sendall(str.encode("ack"))
             else:
                 break
+        byte_stream = bytes(buffer)
         ClientStateListener.build().offer(byte_stream)
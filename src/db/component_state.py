@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import threading
+import time
 from abc import ABC
 from collections import defaultdict
 from datetime import datetime
@@ -34,14 +35,24 @@ SHUTDOWN_SET = {TMCC1EngineCommandDef.SHUTDOWN_DELAYED, (TMCC1EngineCommandDef.N
                 TMCC2EngineCommandDef.SHUTDOWN_DELAYED, (TMCC2EngineCommandDef.NUMERIC, 5),
                 TMCC2EngineCommandDef.SHUTDOWN_IMMEDIATE}
 
+AUX_OPT_ONE_SET = frozenset({Aux.AUX1_OPT_ONE, Aux.AUX2_OPT_ONE})
+
+AUX1_STATE_SET = frozenset({Aux.AUX1_ON, Aux.AUX1_OFF, Aux.AUX1_OPT_TWO})
+
+AUX2_STATE_SET = frozenset({Aux.AUX2_ON, Aux.AUX2_OFF, Aux.AUX2_OPT_TWO})
+
+# offset to convert time.monotonic() readings to wall-clock (epoch) seconds
+MONOTONIC_TO_EPOCH: float = time.time() - time.monotonic()
+
 
 class ComponentState(ABC):
     __metaclass__ = abc.ABCMeta
+    __slots__ = ('_scope', '_last_command', '_last_updated', '_address', '_ev', '_dependencies')
 
     def __init__(self, scope: CommandScope = None) -> None:
         self._scope = scope
         self._last_command: CommandReq | None = None
-        self._last_updated: datetime | None = None
+        self._last_updated: float | None = None  # time.monotonic() of last update
         self._address: int | None = None
         self._ev = threading.Event()
 
@@ -94,8 +105,10 @@ class ComponentState(ABC):
         return self._last_command
 
     @property
-    def last_updated(self) -> datetime:
-        return self._last_updated
+    def last_updated(self) -> datetime | None:
+        if self._last_updated is None:
+            return None
+        return datetime.fromtimestamp(self._last_updated + MONOTONIC_TO_EPOCH)
 
     @property
     def changed(self) -> threading.Event:
@@ -104,23 +117,29 @@ class ComponentState(ABC):
     @abc.abstractmethod
     def update(self, command: L | P) -> None:
         if command and command.command != TMCC1HaltCommandDef.HALT:
-            if self._address is None and command.address != BROADCAST_ADDRESS:
-                self._address = command.address
-            # invalid states
-            elif self._address is None and command.address == BROADCAST_ADDRESS:
+            address = command.address
+            # the common case, an update for this component's own address, skips these checks
+            if address != self._address and address != BROADCAST_ADDRESS:
+                if self._address is None:
+                    self._address = address
+                else:
+                    raise AttributeError(f"{self.friendly_scope} #{self._address} received update for "
+                                         f"{command.scope.name.capitalize()} #{address}, ignoring")
+            # invalid state
+            elif self._address is None:
                 raise AttributeError(f"Received broadcast address for {self.friendly_scope} but component has not "
                                      f"been initialized {self}")
-            elif command.address not in [self._address, BROADCAST_ADDRESS]:
-                raise AttributeError(f"{self.friendly_scope} #{self._address} received update for "
-                                     f"{command.scope.name.capitalize()} #{command.address}, ignoring")
-            if self.scope != command.scope:
+            if self._scope != command.scope:
                 scope = command.scope.name.capitalize()
                 raise AttributeError(f"{self.friendly_scope} {self.address} received update for {scope}, ignoring")
-            self._last_updated = datetime.now()
+            self._last_updated = time.monotonic()
             self._last_command = command
 
-    def time_delta(self, recv_time: datetime) -> float:
-        return (self._last_updated - recv_time).total_seconds()
+    def time_delta(self, recv_time: float) -> float:
+        """
+            Seconds between the last update and recv_time, a time.monotonic() reading
+        """
+        return self._last_updated - recv_time
 
     @property
     def syntax(self) -> CommandSyntax:
@@ -167,6 +186,7 @@ class SwitchState(ComponentState):
     """
         Maintain the perceived state of a Switch
     """
+    __slots__ = ('_state',)
 
     def __init__(self, scope: CommandScope = CommandScope.SWITCH) -> None:
         if scope != CommandScope.SWITCH:
@@ -225,6 +245,8 @@ class SwitchState(ComponentState):
 
 
 class AccessoryState(ComponentState):
+    __slots__ = ('_last_aux1_opt1', '_last_aux2_opt1', '_aux1_state', '_aux2_state', '_aux_state', '_number')
+
     def __init__(self, scope: CommandScope = CommandScope.ACC) -> None:
         if scope != CommandScope.ACC:
             raise ValueError(f"Invalid scope: {scope}")
@@ -252,36 +274,37 @@ class AccessoryState(ComponentState):
         if command:
             super().update(command)
             if isinstance(command, CommandReq):
-                if command.command != Aux.SET_ADDRESS:
-                    if command.command == TMCC1HaltCommandDef.HALT:
+                cmd = command.command
+                if cmd != Aux.SET_ADDRESS:
+                    if cmd == TMCC1HaltCommandDef.HALT:
                         self._aux1_state = Aux.AUX1_OFF
                         self._aux2_state = Aux.AUX2_OFF
                         self._aux_state = Aux.AUX2_OPT_ONE
                         self._number = None
                     else:
-                        if command.command in [Aux.AUX1_OPT_ONE, Aux.AUX2_OPT_ONE]:
-                            self._aux_state = command.command
-                        if command.command == Aux.AUX1_OPT_ONE:
+                        if cmd in AUX_OPT_ONE_SET:
+                            self._aux_state = cmd
+                        if cmd == Aux.AUX1_OPT_ONE:
                             if self._last_aux1_opt1 is None or self.time_delta(self._last_aux1_opt1) > 1:
                                 self._aux1_state = Aux.AUX1_ON if (self._aux1_state is None
                                                                    or self._aux1_state == Aux.AUX1_OPT_ONE
                                                                    or self._aux1_state == Aux.AUX1_OFF) \
                                                                     else Aux.AUX1_OFF
-                            self._last_aux1_opt1 = self.last_updated
-                        elif command.command in [Aux.AUX1_ON, Aux.AUX1_OFF, Aux.AUX1_OPT_TWO]:
-                            self._aux1_state = command.command
-                            self._last_aux1_opt1 = self.last_updated
-                        elif command.command == Aux.AUX2_OPT_ONE:
+                            self._last_aux1_opt1 = self._last_updated
+                        elif cmd in AUX1_STATE_SET:
+                            self._aux1_state = cmd
+                            self._last_aux1_opt1 = self._last_updated
+                        elif cmd == Aux.AUX2_OPT_ONE:
                             if self._last_aux2_opt1 is None or self.time_delta(self._last_aux2_opt1) > 1:
                                 self._aux2_state = Aux.AUX2_ON if (self._aux2_state is None
                                                                    or self._aux2_state == Aux.AUX2_OPT_ONE
                                                                    or self._aux2_state == Aux.AUX2_OFF) \
                                                                     else Aux.AUX2_OFF
-                            self._last_aux2_opt1 = self.last_updated
-                        elif command.command in [Aux.AUX2_ON, Aux.AUX2_OFF, Aux.AUX2_OPT_TWO]:
-                            self._aux2_state = command.command
-                            self._last_aux2_opt1 = self.last_updated
-                        if command.command == Aux.NUMERIC:
+                            self._last_aux2_opt1 = self._last_updated
+                        elif cmd in AUX2_STATE_SET:
+                            self._aux2_state = cmd
+                            self._last_aux2_opt1 = self._last_updated
+                        if cmd == Aux.NUMERIC:
                             self._number = command.data
             elif isinstance(command, Asc2Req):
                 if command.action == Asc2Action.CONTROL1:
@@ -345,6 +368,8 @@ class AccessoryState(ComponentState):
 
 
 class EngineState(ComponentState):
+    __slots__ = ('_start_stop', '_speed', '_direction', '_is_legacy')
+
     def __init__(self, scope: CommandScope = CommandScope.ENGINE) -> None:
 
         if scope not in [CommandScope.ENGINE, CommandScope.TRAIN]:
@@ -460,6 +485,8 @@ class EngineState(ComponentState):
 
 
 class TrainState(EngineState):
+    __slots__ = ()
+
     def __init__(self, scope: CommandScope = CommandScope.TRAIN) -> None:
         if scope not in [CommandScope.TRAIN]:
             raise ValueError(f"Invalid scope: {scope}, expected TRAIN")
@@ -492,12 +519,15 @@ class SystemStateDict(defaultdict):
         return self[key]
 
 
-class ComponentStateDict(defaultdict):
+class ComponentStateDict(dict):
+    __slots__ = ('_scope', '_state_class')
+
     def __init__(self, scope: CommandScope):
-        super().__init__(None)  # base class doesn't get a factory
+        super().__init__()
         if scope not in SCOPE_TO_STATE_MAP:
             raise ValueError(f"Invalid scope: {scope}")
         self._scope = scope
+        self._state_class = SCOPE_TO_STATE_MAP[scope]
 
     @property
     def scope(self) -> CommandScope:
@@ -509,7 +539,7 @@ class ComponentStateDict(defaultdict):
         """
         if not isinstance(key, int) or key < 1 or key > 99:
             raise KeyError(f"Invalid ID: {key}")
-        value: ComponentState = SCOPE_TO_STATE_MAP[self._scope](self._scope)
+        value: ComponentState = self._state_class(self._scope)
         value._address = key
         self[key] = value
         return self[key]
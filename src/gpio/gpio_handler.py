@@ -1,6 +1,11 @@
-import math
+from __future__ import annotations
+
+import threading
 import time
-from threading import Thread
+from array import array
+from functools import partial, lru_cache
+from queue import SimpleQueue
+from threading import Thread, Event
 from typing import Tuple, Callable
 
 from gpiozero import Button, LED, MCP3008, Device
@@ -9,70 +14,119 @@ from ..comm.command_listener import Message
 from ..db.component_state_store import DependencyCache
 from ..gpio.state_source import SwitchStateSource, AccessoryStateSource
 from ..protocol.command_req import CommandReq
-from ..protocol.constants import DEFAULT_BAUDRATE, DEFAULT_PORT, DEFAULT_ADDRESS
 from ..protocol.command_def import CommandDefEnum
-from ..protocol.constants import CommandScope
+from ..protocol.constants import DEFAULT_BAUDRATE, DEFAULT_PORT, DEFAULT_ADDRESS, CommandScope
 from ..protocol.tmcc1.tmcc1_constants import TMCC1SwitchState, TMCC1AuxCommandDef
 from ..protocol.tmcc2.tmcc2_constants import TMCC2RouteCommandDef
 
-DEFAULT_BOUNCE_TIME: float = 0.05  # button debounce threshold
+# button debounce threshold; debouncing is done by the pin factory (lgpio/pigpio do it
+# natively, off of the edge callbacks), so it costs nothing per press in Python
+DEFAULT_BOUNCE_TIME: float = 0.05
 DEFAULT_VARIANCE: float = 0.001  # pot difference variance
+DEFAULT_POLL_HZ: int = 50  # pot sample rate
+
 
+class PotHandler:
+    """
+        Translates the position of a pot, read through an MCP3008 ADC, into command
+        data. Pots don't get their own threads; all of them are sampled by the
+        shared PotPoller
+    """
+    __slots__ = ('_pot', '_command', '_last_value', '_last_raw', '_action', '_interp',
+                 '_threshold', '_delay', '_period', '_next_sample')
 
-class PotHandler(Thread):
     def __init__(self,
                  command: CommandReq,
                  channel: int = 0,
                  data_min: int = None,
                  data_max: int = None,
-                 threshold: float = None,
+                 threshold: int = None,
                  delay: float = None,
+                 poll_hz: int = DEFAULT_POLL_HZ,
+                 pot: MCP3008 = None,
                  baudrate: int = DEFAULT_BAUDRATE,
                  port: int | str = DEFAULT_PORT,
                  server: str = None) -> None:
-        super().__init__(daemon=True)
-        self._pot = MCP3008(channel=channel)
+        self._pot = pot if pot is not None else MCP3008(channel=channel)
         self._command = command
-        self._last_value = None
+        self._last_value: int | None = None
+        self._last_raw: int | None = None
         self._action = command.as_action(baudrate=baudrate, port=port, server=server)
         if data_max is None:
             data_max = command.data_max
         if data_min is None:
             data_min = command.data_min
-        self._interp = self.make_interpolator(data_max, data_min)
+        # map raw ADC codes straight to command data via a precomputed table
+        self._interp = self.make_lookup_table(data_max, data_min, self._pot.bits).__getitem__
+        # interpolated values are always ints, so keep the threshold integral, too
         if threshold is not None:
-            self._threshold = threshold
+            self._threshold: int = int(threshold)
         else:
-            self._threshold = 1 if command.num_data_bits < 6 else 2
+            self._threshold: int = 1 if command.num_data_bits < 6 else 2
         self._delay = delay
-        self._running = True
-        self.start()
+        self._period = 1.0 / poll_hz
+        self._next_sample = 0.0
+        PotPoller.build().add(self)
 
     @property
     def pot(self) -> MCP3008:
         return self._pot
 
-    def run(self) -> None:
-        while self._running:
-            value = self._interp(self._pot.value)
-            if self._last_value is None:
-                self._last_value = value
-                continue
-            elif math.fabs(self._last_value - value) < self._threshold:
-                continue  # pots can take a bit to settle; ignore small changes
-            if self._last_value == 0 and value == 0:
-                continue
-            print(f"New Speed: {self._last_value} -> {value}")
+    @property
+    def period(self) -> float:
+        return self._period
+
+    def tick(self, now: float, samples: dict[int, int]) -> None:
+        """
+            Called by the PotPoller; sample the pot, if due, and send the
+            command if the pot has moved far enough. Samples are shared by
+            all pots reading the same device during a single poller pass
+        """
+        if now < self._next_sample:
+            return
+        self._next_sample = now + self._period
+        raw = samples.get(id(self._pot))
+        if raw is None:
+            raw = samples[id(self._pot)] = self._pot.raw_value
+        if raw == self._last_raw:
+            return  # knob hasn't moved; nothing to recompute or send
+        self._last_raw = raw
+        value = self._interp(raw)
+        last_value = self._last_value
+        if last_value is None:
             self._last_value = value
-            self._command.data = value
-            self._action(new_data=value)
-            if self._delay:
-                time.sleep(self._delay)
+            return
+        elif abs(last_value - value) < self._threshold:
+            return  # pots can take a bit to settle; ignore small changes
+        if last_value == 0 and value == 0:
+            return
+        print(f"New Speed: {last_value} -> {value}")
+        self._last_value = value
+        self._command.data = value
+        self._action()  # data is already applied to the request
+        if self._delay:
+            self._next_sample += self._delay
 
     def reset(self) -> None:
-        self._running = False
+        if PotPoller.is_built():
+            PotPoller.build().remove(self)
 
     @staticmethod
+    @lru_cache(maxsize=32)
+    def make_lookup_table(to_max: int,
+                          to_min: int = 0,
+                          bits: int = 10) -> array:
+        """
+            An n-bit ADC, such as the 10-bit MCP3008, only produces 2**n distinct
+            values, so the interpolation for every one of them can be computed up front.
+            Tables are shared by pots with the same data range; treat them as read-only
+        """
+        num_codes = 1 << bits
+        interp_fn = PotHandler.make_interpolator(to_max, to_min, 0, num_codes - 1)
+        return array('i', (interp_fn(code) for code in range(num_codes)))
+
+    @staticmethod
+    @lru_cache(maxsize=32)
     def make_interpolator(to_max: int,
                           to_min: int = 0,
                           from_min: float = 0.0,
@@ -91,9 +145,231 @@ class PotHandler(Thread):
         return interp_fn
 
 
+class PotPoller(Thread):
+    """
+        A single thread that samples every registered PotHandler, rather
+        than dedicating a thread to each pot
+    """
+    _instance = None
+    _lock = threading.RLock()
+
+    @classmethod
+    def build(cls) -> PotPoller:
+        """
+            Factory method to create a PotPoller instance
+        """
+        return PotPoller()
+
+    @classmethod
+    def is_built(cls) -> bool:
+        return cls._instance is not None
+
+    def __new__(cls, *args, **kwargs):
+        """
+            Provides singleton functionality. We only want one instance
+            of this class in a process
+        """
+        with cls._lock:
+            if PotPoller._instance is None:
+                PotPoller._instance = super(PotPoller, cls).__new__(cls)
+                PotPoller._instance._initialized = False
+            return PotPoller._instance
+
+    def __init__(self) -> None:
+        if self._initialized:
+            return
+        else:
+            self._initialized = True
+        super().__init__(daemon=True, name="PyLegacy Pot Poller")
+        self._pots: Tuple[PotHandler, ...] = ()
+        self._period = 1.0 / DEFAULT_POLL_HZ
+        self._stop_evt = Event()
+        self.start()
+
+    def add(self, pot: PotHandler) -> None:
+        with self._lock:
+            # replace, rather than mutate, the tuple so run() can iterate it without locking
+            self._pots = self._pots + (pot,)
+            self._period = min(p.period for p in self._pots)
+
+    def remove(self, pot: PotHandler) -> None:
+        with self._lock:
+            self._pots = tuple(p for p in self._pots if p is not pot)
+            # slow back down once the fastest pot is gone
+            self._period = min((p.period for p in self._pots), default=1.0 / DEFAULT_POLL_HZ)
+
+    def run(self) -> None:
+        # the wait returns early if shutdown() is called
+        while not self._stop_evt.wait(self._period):
+            now = time.monotonic()
+            samples: dict[int, int] = {}
+            for pot in self._pots:
+                try:
+                    pot.tick(now, samples)
+                except Exception as e:
+                    print(f"Error sampling pot: {e}")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._stop_evt.set()
+            if PotPoller._instance is self:
+                PotPoller._instance = None
+
+
+class ActionDispatcher(Thread):
+    """
+        Runs button actions off of the gpiozero callback thread, so a button press
+        returns immediately, even when sending the command blocks (e.g., as a client)
+    """
+    _instance = None
+    _lock = threading.RLock()
+
+    @classmethod
+    def build(cls) -> ActionDispatcher:
+        """
+            Factory method to create an ActionDispatcher instance
+        """
+        if cls._instance is not None:
+            return cls._instance  # already built; skip __new__/__init__ and the lock
+        return ActionDispatcher()
+
+    @classmethod
+    def is_built(cls) -> bool:
+        return cls._instance is not None
+
+    def __new__(cls, *args, **kwargs):
+        """
+            Provides singleton functionality. We only want one instance
+            of this class in a process
+        """
+        with cls._lock:
+            if ActionDispatcher._instance is None:
+                ActionDispatcher._instance = super(ActionDispatcher, cls).__new__(cls)
+                ActionDispatcher._instance._initialized = False
+            return ActionDispatcher._instance
+
+    def __init__(self) -> None:
+        if self._initialized:
+            return
+        else:
+            self._initialized = True
+        super().__init__(daemon=True, name="PyLegacy GPIO Action Dispatcher")
+        self._queue = SimpleQueue[Callable | None]()
+        self.start()
+
+    def offer(self, action: Callable) -> None:
+        self._queue.put(action)
+
+    def run(self) -> None:
+        while True:
+            action = self._queue.get()
+            if action is None:
+                break
+            try:
+                action()
+            except Exception as e:
+                print(f"Error running GPIO action: {e}")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._queue.put(None)
+            if ActionDispatcher._instance is self:
+                ActionDispatcher._instance = None
+
+
+def _repeat_while_held(action: Callable, button: Button, delay: float) -> None:
+    """
+        Fire the action repeatedly for as long as the button is held
+    """
+    while button.is_active:
+        action()
+        time.sleep(delay)
+
+
+class _OnAction:
+    """
+        Queue an action on the ActionDispatcher, then turn on its LED and turn off
+        any LEDs it impacts. The LEDs change right away, before the action runs,
+        whether or not it succeeds
+    """
+    __slots__ = ('_action', '_led', '_impacted_leds', '_dispatcher')
+
+    def __init__(self, action: Callable, led: LED = None, impacted_leds: Tuple[LED, ...] = ()) -> None:
+        self._action = action
+        self._led = led
+        self._impacted_leds = impacted_leds
+        self._dispatcher = ActionDispatcher.build()  # resolve once, not on every press
+
+    def __call__(self) -> None:
+        self._dispatcher.offer(self._action)
+        if self._led is not None:
+            self._led.on()
+        for impacted_led in self._impacted_leds:
+            impacted_led.off()
+
+
+class _OffAction(_OnAction):
+    """
+        Queue an action on the ActionDispatcher, then turn off its LED and turn on
+        any LEDs it impacts. The LEDs change right away, before the action runs,
+        whether or not it succeeds
+    """
+    __slots__ = ()
+
+    def __call__(self) -> None:
+        self._dispatcher.offer(self._action)
+        if self._led is not None:
+            self._led.off()
+        for impacted_led in self._impacted_leds:
+            impacted_led.on()
+
+
+class _ToggleAction:
+    """
+        Queue an action on the ActionDispatcher, then flip the state of its LED.
+        The LED changes right away, before the action runs, whether or not it succeeds
+    """
+    __slots__ = ('_action', '_led', '_dispatcher')
+
+    def __init__(self, action: Callable, led: LED) -> None:
+        self._action = action
+        self._led = led
+        self._dispatcher = ActionDispatcher.build()  # resolve once, not on every press
+
+    def __call__(self) -> None:
+        self._dispatcher.offer(self._action)
+        if self._led.value:
+            self._led.off()
+        else:
+            self._led.on()
+
+
+class _LedListener:
+    """
+        Subscriber that turns LEDs on and off in response to received commands,
+        optionally filtered to a single TMCC address. Listeners are registered on
+        (scope, address, command) channels, but commands sent to the broadcast
+        address reach every listener on the scope, hence the address check
+    """
+    __slots__ = ('_address', '_leds_on', '_leds_off')
+
+    def __init__(self, address: int | None, leds_on: Tuple[LED, ...], leds_off: Tuple[LED, ...] = ()) -> None:
+        self._address = address
+        self._leds_on = leds_on
+        self._leds_off = leds_off
+
+    def __call__(self, message: Message) -> None:
+        if self._address is None or message.address == self._address:
+            for led in self._leds_on:
+                led.on()
+            for led in self._leds_off:
+                led.off()
+
+
 class GpioHandler:
-    GPIO_DEVICE_CACHE = set()
-    GPIO_HANDLER_CACHE = set()
+    GPIO_DEVICE_CACHE: list[Device] = []
+    GPIO_HANDLER_CACHE: list[Thread | PotHandler] = []
+    GPIO_POT_CACHE: dict[int, MCP3008] = {}
 
     @classmethod
     def route(cls,
@@ -300,9 +576,8 @@ class GpioHandler:
             rotate_boom_req = CommandReq.build(TMCC1AuxCommandDef.RELATIVE_SPEED, address)
 
             knob = PotHandler(rotate_boom_req, channel, data_min=-3, data_max=3, threshold=0, delay=0.2,
-                              baudrate=baudrate, port=port, server=server)
+                              pot=cls._pot_device(channel), baudrate=baudrate, port=port, server=server)
             cls._cache_handler(knob)
-            cls._cache_device(knob.pot)
 
             lights_on_req, lights_on_btn, lights_on_led = cls._make_button(lights_on_pin,
                                                                            TMCC1AuxCommandDef.NUMERIC,
@@ -351,7 +626,10 @@ class GpioHandler:
                             ) -> Button:
 
         # Use helper method to construct objects
-        command, button, led = cls._make_button(pin, command, address, data, scope, led_pin)
+        if led_pin is None or led_pin == 0:
+            command, button = cls._make_button_no_led(pin, command, address, data, scope)
+        else:
+            command, button, _ = cls._make_button(pin, command, address, data, scope, led_pin)
 
         # create a command function to fire when button pressed
         button.when_pressed = command.as_action(baudrate=baudrate, port=port, server=server)
@@ -372,7 +650,10 @@ class GpioHandler:
                          ) -> Button:
 
         # Use helper method to construct objects
-        command, button, led = cls._make_button(pin, command, address, data, scope, led_pin)
+        if led_pin is None or led_pin == 0:
+            command, button = cls._make_button_no_led(pin, command, address, data, scope)
+        else:
+            command, button, _ = cls._make_button(pin, command, address, data, scope, led_pin)
 
         # create a command function to fire when button held
         button.when_held = command.as_action(baudrate=baudrate, port=port, server=server)
@@ -410,15 +691,8 @@ class GpioHandler:
             off_button.when_pressed = cls._with_off_action(off_action, led)
             on_button.when_pressed = cls._with_on_action(on_action, led)
 
-            def func_off(_: Message) -> None:
-                led.off()
-
-            DependencyCache.listen_for_disablers(on_command, func_off)
-
-            def func_on(_: Message) -> None:
-                led.on()
-
-            DependencyCache.listen_for_enablers(on_command, func_on)
+            DependencyCache.listen_for_disablers(on_command, _LedListener(None, (), (led,)))
+            DependencyCache.listen_for_enablers(on_command, _LedListener(None, (led,)))
 
         else:
             off_button.when_pressed = off_action
@@ -475,25 +749,46 @@ class GpioHandler:
             command = CommandReq.build(command, address, 0, scope)
         if command.num_data_bits == 0:
             raise ValueError("Command does not support variable data")
-        knob = PotHandler(command, channel, baudrate=baudrate, port=port, server=server)
+        knob = PotHandler(command, channel, pot=cls._pot_device(channel),
+                          baudrate=baudrate, port=port, server=server)
         cls._cache_handler(knob)
-        cls._cache_device(knob.pot)
         return knob
 
+    @classmethod
+    def use_pigpio(cls, host: str = None, port: int = None) -> None:
+        """
+            Switch all subsequently created GPIO devices to the pigpio pin factory,
+            which samples every GPIO pin from a single DMA-driven daemon rather than
+            watching each pin individually. Requires the pigpio package and a running
+            pigpiod; call before any buttons, LEDs, or pots are created.
+        """
+        from gpiozero.pins.pigpio import PiGPIOFactory
+        Device.pin_factory = PiGPIOFactory(host=host, port=port)
+
     @classmethod
     def reset_all(cls) -> None:
         for handler in cls.GPIO_HANDLER_CACHE:
             handler.reset()
-            handler.join()  # wait for thread to shut down
-        cls.GPIO_HANDLER_CACHE = set()
+            if isinstance(handler, Thread):
+                handler.join()  # wait for thread to shut down
+        cls.GPIO_HANDLER_CACHE = []
+
+        if PotPoller.is_built():
+            poller = PotPoller.build()
+            poller.shutdown()
+            poller.join()
 
         for device in cls.GPIO_DEVICE_CACHE:
             device.close()
-        cls.GPIO_DEVICE_CACHE = set()
+        cls.GPIO_DEVICE_CACHE = []
+        cls.GPIO_POT_CACHE = {}
+
+        if ActionDispatcher.is_built():
+            ActionDispatcher.build().shutdown()
 
     @classmethod
-    def _cache_handler(cls, handler: Thread) -> None:
-        cls.GPIO_HANDLER_CACHE.add(handler)
+    def _cache_handler(cls, handler: Thread | PotHandler) -> None:
+        cls.GPIO_HANDLER_CACHE.append(handler)
 
     @classmethod
     def release_device(cls, device: Device) -> None:
@@ -504,12 +799,26 @@ class GpioHandler:
         """
             Keep devices around after creation so they remain in scope
         """
-        cls.GPIO_DEVICE_CACHE.add(device)
+        cls.GPIO_DEVICE_CACHE.append(device)
 
     @classmethod
     def _release_device(cls, device: Device) -> None:
         device.close()
         cls.GPIO_DEVICE_CACHE.remove(device)
+        for channel, pot in list(cls.GPIO_POT_CACHE.items()):
+            if pot is device:
+                del cls.GPIO_POT_CACHE[channel]
+
+    @classmethod
+    def _pot_device(cls, channel: int) -> MCP3008:
+        """
+            Pots that read the same MCP3008 channel share a single device
+        """
+        if channel not in cls.GPIO_POT_CACHE:
+            pot = MCP3008(channel=channel)
+            cls.GPIO_POT_CACHE[channel] = pot
+            cls._cache_device(pot)
+        return cls.GPIO_POT_CACHE[channel]
 
     @classmethod
     def _make_button(cls,
@@ -524,16 +833,7 @@ class GpioHandler:
                      initially_on: bool = False,
                      bind: bool = False,
                      cathode: bool = True) -> Tuple[CommandReq, Button, LED]:
-        # if command is actually a CommandDefEnum, build a CommandReq
-        if isinstance(command, CommandDefEnum):
-            command = CommandReq.build(command, address=address, data=data, scope=scope)
-
-        # create the button object we will associate an action with
-        button = Button(pin, bounce_time=DEFAULT_BOUNCE_TIME)
-        if held is True:
-            button.hold_repeat = held
-            button.hold_repeat = frequency
-        cls._cache_device(button)
+        command, button = cls._make_button_no_led(pin, command, address, data, scope, held, frequency)
 
         # create a LED, if asked, and tie its source to the button
         if led_pin is not None and led_pin != 0:
@@ -546,71 +846,48 @@ class GpioHandler:
             led = None
         return command, button, led
 
+    @classmethod
+    def _make_button_no_led(cls,
+                            pin: int | str,
+                            command: CommandReq | CommandDefEnum,
+                            address: int = DEFAULT_ADDRESS,
+                            data: int = None,
+                            scope: CommandScope = None,
+                            held: bool = False,
+                            frequency: float = 0.06) -> Tuple[CommandReq, Button]:
+        # if command is actually a CommandDefEnum, build a CommandReq
+        if isinstance(command, CommandDefEnum):
+            command = CommandReq.build(command, address=address, data=data, scope=scope)
+
+        # create the button object we will associate an action with
+        button = Button(pin, bounce_time=DEFAULT_BOUNCE_TIME)
+        if held is True:
+            button.hold_repeat = held
+            button.hold_repeat = frequency
+        cls._cache_device(button)
+        return command, button
+
     @classmethod
     def _with_held_action(cls,
                           action: Callable,
                           button: Button,
                           delay: float = 0.10) -> Callable:
-
-        def held_action() -> None:
-            while button.is_active:
-                action()
-                time.sleep(delay)
-
-        return held_action
+        return partial(_repeat_while_held, action, button, delay)
 
     @classmethod
     def _with_toggle_action(cls, action: Callable, led: LED) -> Callable:
-        def toggle_action() -> None:
-            action()
-            if led.value:
-                led.off()
-            else:
-                led.on()
-
-        return toggle_action
+        return _ToggleAction(action, led)
 
     @classmethod
     def _with_off_action(cls, action: Callable, led: LED = None, *impacted_leds: LED) -> Callable:
-        def off_action() -> None:
-            action()
-            if led is not None:
-                led.off()
-            if impacted_leds:
-                for impacted_led in impacted_leds:
-                    impacted_led.on()
-
-        return off_action
+        return _OffAction(action, led, impacted_leds)
 
     @classmethod
     def _with_on_action(cls, action: Callable, led: LED, *impacted_leds: LED) -> Callable:
-
-        def on_action() -> None:
-            action()
-            if led is not None:
-                led.on()
-            if impacted_leds:
-                for impacted_led in impacted_leds:
-                    impacted_led.off()
-
-        return on_action
+        return _OnAction(action, led, impacted_leds)
 
     @classmethod
     def _create_listeners(cls, req, active_led: LED = None, *inactive_leds: LED) -> None:
-
-        def func_on(msg: Message) -> None:
-            if msg.address == req.address:
-                if active_led is not None:
-                    active_led.on()
-                for led in inactive_leds:
-                    led.off()
-
-        def func_off(msg: Message) -> None:
-            if msg.address == req.address:
-                if active_led is not None:
-                    active_led.off()
-                for led in inactive_leds:
-                    led.on()
-
-        DependencyCache.listen_for_enablers(req, func_on)
-        DependencyCache.listen_for_disablers(req, func_off)
+        active_leds = (active_led,) if active_led is not None else ()
+        DependencyCache.listen_for_enablers(req, _LedListener(req.address, active_leds, inactive_leds))
+        DependencyCache.listen_for_disablers(req, _LedListener(req.address, inactive_leds, active_leds))
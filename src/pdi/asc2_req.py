@@ -135,33 +135,30 @@ class Asc2Req(LcsReq):
                 return f"{'THROUGH' if self.values == 0 else 'OUT'} ({self.packet})"
         return super().payload
 
-    @property
-    def as_bytes(self) -> bytes:
-        from .constants import PdiCommand, Asc2Action, PDI_EOP, PDI_SOP
-        byte_str = self.pdi_command.as_bytes
-        byte_str += self.tmcc_id.to_bytes(1, byteorder='big')
-        byte_str += self.action.as_bytes
+    def _build_bytes(self) -> bytes:
+        from .constants import PdiCommand, Asc2Action
+        byte_str = bytearray((self.pdi_command, self.tmcc_id, self.action.bits))
         if self._action == Asc2Action.CONFIG:
             if self.pdi_command != PdiCommand.ASC2_GET:
                 debug = (self.debug if self.debug is not None else 0)
                 delay = (int(round((self.delay * 100))) if self.delay is not None else 0)
-                byte_str += self.tmcc_id.to_bytes(1, byteorder='big')  # allows board to be renumbered
-                byte_str += debug.to_bytes(1, byteorder='big')
-                byte_str += (0x0000).to_bytes(2, byteorder='big')
-                byte_str += self.mode.to_bytes(1, byteorder='big')
-                byte_str += delay.to_bytes(1, byteorder='big')
+                byte_str.append(self.tmcc_id)  # allows board to be renumbered
+                byte_str.append(debug)
+                byte_str += bytes(2)
+                byte_str.append(self.mode)
+                byte_str.append(delay)
         elif self._action == Asc2Action.CONTROL1:
             if self.pdi_command != PdiCommand.ASC2_GET:
                 values = (self.values if self.values is not None else 0)
                 time = (int(round((self.time * 100))) if self.time is not None else 0)
-                byte_str += values.to_bytes(1, byteorder='big')
-                byte_str += time.to_bytes(1, byteorder='big')
+                byte_str.append(values)
+                byte_str.append(time)
         elif self._action == Asc2Action.CONTROL2:
             if self.pdi_command != PdiCommand.ASC2_GET:
                 values = (self.values if self.values is not None else 0)
                 valids = (self.values if self.valids is not None else 0)
-                byte_str += values.to_bytes(1, byteorder='big')
-                byte_str += valids.to_bytes(1, byteorder='big')
+                byte_str.append(values)
+                byte_str.append(valids)
         elif self._action == Asc2Action.CONTROL3:
             if self.pdi_command != PdiCommand.ASC2_GET:
                 if self.pdi_command == PdiCommand.ASC2_SET:
@@ -173,25 +170,21 @@ class Asc2Req(LcsReq):
                 else:
                     values = (self.values if self.valids is not None else 0)
                     valids = (self.valids if self.valids is not None else 0)
-                byte_str += values.to_bytes(1, byteorder='big')
-                byte_str += valids.to_bytes(1, byteorder='big')
+                byte_str.append(values)
+                byte_str.append(valids)
         elif self._action == Asc2Action.CONTROL4:
             if self.pdi_command != PdiCommand.ASC2_GET:
                 values = (self.values if self.values is not None else 0)
                 time = (int(round((self.time * 100))) if self.time is not None else 0)
                 if time == 1:
                     time = 0
-                byte_str += values.to_bytes(1, byteorder='big')
-                byte_str += time.to_bytes(1, byteorder='big')
+                byte_str.append(values)
+                byte_str.append(time)
         elif self._action == Asc2Action.CONTROL5:
             if self.pdi_command != PdiCommand.ASC2_GET:
                 values = (self.values if self.values is not None else 0)
-                byte_str += values.to_bytes(1, byteorder='big')
+                byte_str.append(values)
         elif self._action == Asc2Action.IDENTIFY:
             if self.pdi_command == PdiCommand.ASC2_SET:
-                byte_str += (self.ident if self.ident is not None else 0).to_bytes(1, byteorder='big')
-        byte_str, checksum = self._calculate_checksum(byte_str)
-        byte_str = PDI_SOP.to_bytes(1, byteorder='big') + byte_str
-        byte_str += checksum
-        byte_str += PDI_EOP.to_bytes(1, byteorder='big')
-        return byte_str
+                byte_str.append(self.ident if self.ident is not None else 0)
+        return self._frame(byte_str)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from src.pdi.constants import PdiCommand, Bpc2Action, PDI_SOP, PDI_EOP
+from src.pdi.constants import PdiCommand, Bpc2Action
 from src.pdi.pdi_req import LcsReq
 from src.protocol.constants import CommandScope
 
@@ -90,41 +90,34 @@ class Bpc2Req(LcsReq):
                 return f"Mode: {self.mode} Debug: Restore: {self.restore} {self.debug} ({self.packet})"
         return f" ({self.packet})"
 
-    @property
-    def as_bytes(self) -> bytes:
-        byte_str = self.pdi_command.as_bytes
-        byte_str += self.tmcc_id.to_bytes(1, byteorder='big')
-        byte_str += self.action.as_bytes
+    def _build_bytes(self) -> bytes:
+        byte_str = bytearray((self.pdi_command, self.tmcc_id, self.action.bits))
 
         if self._action == Bpc2Action.CONFIG:
             if self.pdi_command != PdiCommand.BPC2_GET:
                 debug = (self.debug if self.debug is not None else 0)
                 mode = self.mode | 0x80 if self.restore else self.mode
-                byte_str += self.tmcc_id.to_bytes(1, byteorder='big')  # allows board to be renumbered
-                byte_str += debug.to_bytes(1, byteorder='big')
-                byte_str += (0x0000).to_bytes(2, byteorder='big')
-                byte_str += mode.to_bytes(1, byteorder='big')
+                byte_str.append(self.tmcc_id)  # allows board to be renumbered
+                byte_str.append(debug)
+                byte_str += bytes(2)
+                byte_str.append(mode)
         elif self._action == Bpc2Action.IDENTIFY:
             if self.pdi_command == PdiCommand.BPC2_SET:
-                byte_str += (self.ident if self.ident is not None else 0).to_bytes(1, byteorder='big')
+                byte_str.append(self.ident if self.ident is not None else 0)
         elif self._action in [Bpc2Action.CONTROL1, Bpc2Action.CONTROL3]:
             if self.pdi_command != PdiCommand.BPC2_GET:
-                byte_str += (self.state if self.state is not None else 0).to_bytes(1, byteorder='big')
+                byte_str.append(self.state if self.state is not None else 0)
         elif self._action in [Bpc2Action.CONTROL2, Bpc2Action.CONTROL4]:
             if self.pdi_command != PdiCommand.BPC2_GET:
-                byte_str += (self.state if self.state is not None else 0).to_bytes(1, byteorder='big')
+                byte_str.append(self.state if self.state is not None else 0)
                 values = (self.values if self.values is not None else 0)
                 valids = (self.values if self.valids is not None else 0)
-                byte_str += values.to_bytes(1, byteorder='big')
-                byte_str += valids.to_bytes(1, byteorder='big')
+                byte_str.append(values)
+                byte_str.append(valids)
         elif self._action == Bpc2Action.CONTROL2:
             if self.pdi_command != PdiCommand.BPC2_GET:
                 values = (self.values if self.values is not None else 0)
                 valids = (self.values if self.valids is not None else 0)
-                byte_str += values.to_bytes(1, byteorder='big')
-                byte_str += valids.to_bytes(1, byteorder='big')
-        byte_str, checksum = self._calculate_checksum(byte_str)
-        byte_str = PDI_SOP.to_bytes(1, byteorder='big') + byte_str
-        byte_str += checksum
-        byte_str += PDI_EOP.to_bytes(1, byteorder='big')
-        return byte_str
+                byte_str.append(values)
+                byte_str.append(valids)
+        return self._frame(byte_str)
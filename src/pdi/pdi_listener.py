@@ -2,17 +2,19 @@ from __future__ import annotations
 
 import socket
 import threading
-from collections import deque, defaultdict
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, SimpleQueue, Full
 from threading import Thread
 from typing import Tuple
 
-from .constants import PDI_SOP, PDI_STF, PDI_EOP, PdiAction
+from .constants import PDI_SOP, PDI_STF, PDI_EOP, PING, PdiAction
 from .pdi_req import PdiReq, TmccReq
 from ..comm.command_listener import Topic, Message, Channel, Subscriber, CommandDispatcher
 from ..comm.enqueue_proxy_requests import EnqueueProxyRequests
 from ..protocol.constants import DEFAULT_QUEUE_SIZE, DEFAULT_BASE3_PORT, BROADCAST_TOPIC
 
+DEFAULT_CLIENT_BATCH_SIZE: int = 16  # max PDI state updates sent to a client per connection
+
 
 class PdiListener(Thread):
     _instance: None = None
@@ -104,8 +106,9 @@ class PdiListener(Thread):
         # create the thread
 
         # prep our consumer(s)
-        self._cv = threading.Condition()
-        self._deque = deque(maxlen=DEFAULT_QUEUE_SIZE)
+        self._buffer = bytearray()
+        self._buffer_lock = threading.Lock()
+        self._requests = SimpleQueue[PdiReq | None]()
         self._is_running = True
         self._dispatcher = PdiDispatcher.build(queue_size)
 
@@ -117,64 +120,68 @@ class PdiListener(Thread):
         return self._dispatcher
 
     def run(self) -> None:
-        eop_pos = -1
         while self._is_running:
-            # process bytes, as long as there are any
-            with self._cv:
-                if not self._deque:
-                    self._cv.wait()  # wait to be notified
-            # check if the first bite is in the list of allowable command prefixes
-            dq_len = len(self._deque)
-            while dq_len > 0:  # may indicate thread is exiting
-                # we now begin a state machine where we look for an SOP/EOP pair. Throw away
-                # bytes until we see an SOP
-                if self._deque[0] == PDI_SOP:
-                    # we've found the possible start of a PDI command sequence. Check if we've found
-                    # a PDI_EOP byte, or a "stuff" byte; we handle each situation separately
-                    # if eop_pos != -1, we have to look past eop_pos for the next possible eop 
-                    # TODO: modify index expression
-                    try:
-                        eop_pos = self._deque.index(PDI_EOP)
-                    except ValueError:
-                        # no luck, wait for more bytes; should we impose a maximum byte count?
-                        dq_len = -1  # to bypass inner while loop; we need more data
-                        continue
-                    # make sure preceding byte isn't a stuff byte
-                    if eop_pos - 1 > 0:
-                        if self._deque[eop_pos - 1] == PDI_STF:
-                            print("*** we found an unhandled stuff-it")
-                            continue  # this isn't really an EOF
-                        # we found a complete PDI packet! Queue it for processing
-                        req_bytes = bytes()
-                        for _ in range(eop_pos + 1):
-                            req_bytes += self._deque.popleft().to_bytes(1, byteorder='big')
-                            dq_len -= 1
-                        try:
-                            eop_pos = -1
-                            self._dispatcher.offer(PdiReq.from_bytes(req_bytes))
-                        except Exception as e:
-                            print(f"Failed to dispatch request {req_bytes.hex(':')}: {e}")
-                        continue  # with while dq_len > 0 loop
-                # pop this byte and continue; we either received unparsable input
-                # or started receiving data mid-command
-                print(f"Ignoring {hex(self._deque.popleft())}")
-                dq_len -= 1
-                eop_pos = -1
+            pdi_req = self._requests.get()
+            if pdi_req is None:  # shutdown
+                break
+            self._dispatcher.offer(pdi_req)
         # shut down the dispatcher
         if self._dispatcher:
             self._dispatcher.shutdown()
 
+    @staticmethod
+    def _next_packet(buffer: bytearray) -> bytes | None:
+        """
+            Remove and return the first complete SOP...EOP packet in buffer, discarding
+            any bytes that precede its SOP. Returns None if no complete packet is available
+        """
+        sop = buffer.find(PDI_SOP)
+        if sop == -1:
+            if buffer:
+                print(f"Ignoring {buffer.hex(':')}")
+                buffer.clear()
+            return None
+        if sop > 0:
+            # we either received unparsable input or started receiving data mid-command
+            print(f"Ignoring {buffer[:sop].hex(':')}")
+            del buffer[:sop]
+        eop = buffer.find(PDI_EOP, 1)
+        while eop != -1:
+            # an EOP preceded by an odd number of stuff bytes is data, not the end of the packet
+            stf = eop - 1
+            while buffer[stf] == PDI_STF:
+                stf -= 1
+            if (eop - 1 - stf) % 2 == 0:
+                break
+            eop = buffer.find(PDI_EOP, eop + 1)
+        if eop == -1:
+            return None  # wait for more bytes
+        req_bytes = bytes(buffer[:eop + 1])
+        del buffer[:eop + 1]
+        return req_bytes
+
     def offer(self, data: bytes) -> None:
+        """
+            Receive bytes read from the Base 3. Packets are framed and parsed as the
+            bytes arrive, and only complete requests are queued for the listener
+            thread; partial packets wait in the buffer for the rest of their bytes.
+            Pings are never dispatched, so we drop them without parsing them
+        """
         if data:
-            with self._cv:
-                self._deque.extend(data)
-                self._cv.notify()
+            with self._buffer_lock:
+                self._buffer += data
+                while (req_bytes := self._next_packet(self._buffer)) is not None:
+                    if req_bytes[1] == PING:
+                        continue
+                    try:
+                        self._requests.put(PdiReq.from_bytes(req_bytes))
+                    except Exception as e:
+                        print(f"Failed to parse request {req_bytes.hex(':')}: {e}")
 
     def shutdown(self) -> None:
-        if hasattr(self, "_cv"):
-            with self._cv:
-                self._is_running = False
-                self._cv.notify()
+        if hasattr(self, "_requests"):
+            self._is_running = False
+            self._requests.put(None)
         if hasattr(self, "_dispatcher"):
             if self._dispatcher:
                 self._dispatcher.shutdown()
@@ -249,13 +256,15 @@ class PdiDispatcher(Thread):
         else:
             self._initialized = True
         super().__init__(daemon=True, name="PyLegacy Pdi Dispatcher")
-        self._channels: dict[Topic | Tuple[Topic, int], Channel[Message]] = defaultdict(Channel)
-        self._cv = threading.Condition()
+        self._channels: dict[Topic | Tuple[Topic, int], Channel[Message]] = {}
         self._is_running = True
         self._broadcasts = False
-        self._queue = Queue[PdiReq](queue_size)
+        self._queue = Queue[PdiReq | None](queue_size)
         self._tmcc_dispatcher = CommandDispatcher.build(queue_size)
-        self._client_port = EnqueueProxyRequests.port if EnqueueProxyRequests.is_built else None
+        self._client_port = EnqueueProxyRequests.port() if EnqueueProxyRequests.is_built() else None
+        self._client_updates = bytearray()
+        self._num_client_updates = 0
+        self._client_senders: dict[str, ThreadPoolExecutor] = {}
         self.start()
 
     @property
@@ -264,12 +273,9 @@ class PdiDispatcher(Thread):
 
     def run(self) -> None:
         while self._is_running:
-            with self._cv:
-                if self._queue.empty():
-                    self._cv.wait()
-            if self._queue.empty():  # we need to do a second check in the event we're being shutdown
-                continue
-            cmd: PdiReq = self._queue.get()
+            cmd: PdiReq | None = self._queue.get()
+            if cmd is None:  # shutdown
+                break
             try:
                 # publish dispatched pdi commands to listeners
                 if isinstance(cmd, PdiReq):
@@ -277,37 +283,65 @@ class PdiDispatcher(Thread):
                     if isinstance(cmd, TmccReq):
                         self._tmcc_dispatcher.offer(cmd.tmcc_command)
                     else:
-                        self.publish((cmd.scope, cmd.tmcc_id, cmd.action), cmd)
-                        self.publish((cmd.scope, cmd.tmcc_id), cmd)
-                        self.publish(cmd.scope, cmd)
+                        for topic in cmd.topic_keys:
+                            self.publish(topic, cmd)
                     if self._broadcasts:
                         self.publish(BROADCAST_TOPIC, cmd)
                     if self._client_port is not None:
                         self.update_client_state(cmd)
+                # send client updates once we've caught up, or have accumulated a full batch
+                if self._num_client_updates and \
+                        (self._num_client_updates >= DEFAULT_CLIENT_BATCH_SIZE or self._queue.empty()):
+                    self.flush_client_state()
             except Exception as e:
                 print(e)
-            finally:
-                self._queue.task_done()
 
     def update_client_state(self, command: PdiReq):
         """
-            Update all PyTrain clients with the dispatched command. Used to keep
-            client states in sync with server
+            Queue the dispatched command to update all PyTrain clients with. Used
+            to keep client states in sync with server. Updates are batched, so that
+            a burst of commands reaches each client over a single connection
         """
         if self._client_port is not None:
+            self._client_updates += command.as_bytes
+            self._num_client_updates += 1
+
+    def flush_client_state(self) -> None:
+        """
+            Send all pending state updates to each PyTrain client. Clients frame
+            incoming PDI packets themselves, so several can share one connection.
+            Each client has its own sender thread, so a slow client doesn't hold up
+            the others, or this thread, and its updates still arrive in order. Once
+            shut down, the sender threads are gone, so nothing more is sent
+        """
+        if self._client_updates and self._is_running:
+            payload = bytes(self._client_updates)
+            self._client_updates.clear()
+            self._num_client_updates = 0
             # noinspection PyTypeChecker
-            for client in EnqueueProxyRequests.clients:
-                try:
-                    with self._lock:
-                        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                            s.connect((client, self._client_port))
-                            s.sendall(command.as_bytes)
-                            _ = s.recv(16)
-                except ConnectionRefusedError:
-                    # ignore disconnects; client will receive state update on reconnect
-                    pass
-                except Exception as e:
-                    print(f"Exception while sending PDI state update to {client}: {e}")
+            for client in EnqueueProxyRequests.clients():
+                sender = self._client_senders.get(client)
+                if sender is None:
+                    sender = self._client_senders[client] = \
+                        ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"PyLegacy PDI Client {client}")
+                sender.submit(self._send_to_client, client, payload)
+
+    def _send_to_client(self, client: str, payload: bytes) -> None:
+        """
+            Clients treat each connection as one message, processing it once the
+            connection closes, so we can't keep connections open between updates.
+            Only the client's sender thread calls this, so no lock is needed here
+        """
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.connect((client, self._client_port))
+                s.sendall(payload)
+                _ = s.recv(16)
+        except ConnectionRefusedError:
+            # ignore disconnects; client will receive state update on reconnect
+            pass
+        except Exception as e:
+            print(f"Exception while sending PDI state update to {client}: {e}")
 
     def offer(self, pdi_req: PdiReq) -> None:
         """
@@ -315,14 +349,16 @@ class PdiDispatcher(Thread):
             We do this in a separate thread so that the listener thread doesn't fall behind
         """
         if pdi_req is not None and isinstance(pdi_req, PdiReq) and not pdi_req.is_ping:
-            with self._cv:
-                self._queue.put(pdi_req)
-                self._cv.notify()  # wake up receiving thread
+            self._queue.put(pdi_req)
 
     def shutdown(self) -> None:
-        with self._cv:
-            self._is_running = False
-            self._cv.notify()
+        self._is_running = False
+        try:
+            self._queue.put_nowait(None)  # wake up the dispatch thread
+        except Full:
+            pass  # thread is busy; it will see _is_running on its next pass
+        for sender in list(self._client_senders.values()):  # dispatch thread may still be adding senders
+            sender.shutdown(wait=False, cancel_futures=True)
         PdiDispatcher._instance = None
 
     @staticmethod
@@ -339,8 +375,9 @@ class PdiDispatcher(Thread):
             return channel, address, action
 
     def publish(self, channel: Topic, message: Message) -> None:
-        if channel in self._channels:  # otherwise, we would create a channel simply by referencing i
-            self._channels[channel].publish(message)
+        subscribers = self._channels.get(channel)
+        if subscribers is not None:
+            subscribers.publish(message)
 
     def subscribe(self,
                   subscriber: Subscriber,
@@ -350,7 +387,8 @@ class PdiDispatcher(Thread):
         if channel == BROADCAST_TOPIC:
             self.subscribe_any(subscriber)
         else:
-            self._channels[self._make_channel(channel, address, action)].subscribe(subscriber)
+            channel = self._make_channel(channel, address, action)
+            self._channels.setdefault(channel, Channel()).subscribe(subscriber)
 
     def unsubscribe(self,
                     subscriber: Subscriber,
@@ -361,17 +399,22 @@ class PdiDispatcher(Thread):
             self.unsubscribe_any(subscriber)
         else:
             channel = self._make_channel(channel, address, command)
-            self._channels[channel].unsubscribe(subscriber)
-            if len(self._channels[channel].subscribers) == 0:
-                del self._channels[channel]
+            subscribers = self._channels.get(channel)
+            if subscribers is not None:
+                subscribers.unsubscribe(subscriber)
+                if len(subscribers.subscribers) == 0:
+                    del self._channels[channel]
 
     def subscribe_any(self, subscriber: Subscriber) -> None:
         # receive broadcasts
-        self._channels[BROADCAST_TOPIC].subscribe(subscriber)
+        self._channels.setdefault(BROADCAST_TOPIC, Channel()).subscribe(subscriber)
         self._broadcasts = True
 
     def unsubscribe_any(self, subscriber: Subscriber) -> None:
         # receive broadcasts
-        self._channels[BROADCAST_TOPIC].unsubscribe(subscriber)
-        if not self._channels[BROADCAST_TOPIC].subscribers:
-            self._broadcasts = False
+        subscribers = self._channels.get(BROADCAST_TOPIC)
+        if subscribers is not None:
+            subscribers.unsubscribe(subscriber)
+            if not subscribers.subscribers:
+                del self._channels[BROADCAST_TOPIC]
+                self._broadcasts = False
@@ -12,24 +12,51 @@ from ..protocol.constants import CommandScope
 
 T = TypeVar('T', bound=PdiAction)
 
+SOP_BYTE: bytes = PDI_SOP.to_bytes(1, byteorder='big')
+STF_BYTE: bytes = PDI_STF.to_bytes(1, byteorder='big')
+EOP_BYTE: bytes = PDI_EOP.to_bytes(1, byteorder='big')
+STUFFED_SOP: bytes = STF_BYTE + SOP_BYTE
+STUFFED_STF: bytes = STF_BYTE + STF_BYTE
+STUFFED_EOP: bytes = STF_BYTE + EOP_BYTE
+STUFF_CODES: frozenset[int] = frozenset({PDI_SOP, PDI_STF, PDI_EOP})  # bytes that must be stuffed
+
 
 class PdiReq(ABC):
     __metaclass__ = abc.ABCMeta
+    COMMAND_TO_REQ_CLASS: dict[int, type[PdiReq]] = {}
 
     @classmethod
     def from_bytes(cls, data: bytes) -> Self:
-        # throws an exception if we can't dereference
-        pdi_cmd = PdiCommand(data[1])
-        try:
-            from .constants import PdiDevice
-            dev = PdiDevice(pdi_cmd.name.split('_')[0].upper())
-            return dev.build(data)
-        except ValueError:
+        req_class = cls._req_class_map().get(data[1])
+        if req_class is None:
+            # throws an exception if we can't dereference
+            pdi_cmd = PdiCommand(data[1])
             raise NotImplementedError(f"PdiCommand {pdi_cmd.name} not implemented")
+        return req_class(data)
+
+    @classmethod
+    def _req_class_map(cls) -> dict[int, type[PdiReq]]:
+        """
+            Map each PdiCommand byte straight to the class that decodes it, so we
+            don't construct enums or split names for every packet we receive.
+            Built on first use, as PdiDevice imports the request classes
+        """
+        if not PdiReq.COMMAND_TO_REQ_CLASS:
+            from .constants import PdiDevice
+            req_classes = {}
+            for pdi_cmd in PdiCommand:
+                try:
+                    req_classes[pdi_cmd.value] = PdiDevice(pdi_cmd.name.split('_')[0]).value.req_class
+                except ValueError:
+                    pass  # no device for this command; from_bytes raises NotImplementedError
+            PdiReq.COMMAND_TO_REQ_CLASS = req_classes
+        return PdiReq.COMMAND_TO_REQ_CLASS
 
     def __init__(self,
                  data: bytes | None,
                  pdi_command: PdiCommand = None) -> None:
+        self._as_bytes: bytes | None = None
+        self._topic_keys: Tuple | None = None
         if isinstance(data, bytes):
             # first byte should be SOP, last should be EOP, if not, raise exception
             if data[0] != PDI_SOP or data[-1] != PDI_EOP:
@@ -37,8 +64,11 @@ class PdiReq(ABC):
             # process the data to remove SOP, EOP, Checksum, and Stuff Bytes, if any
             self._original = data
             recv_checksum = data[-2]
-            self._data, check_sum = self._calculate_checksum(data[1:-2], False)
-            if recv_checksum != int.from_bytes(check_sum):
+            # a checksum that is itself a special byte is preceded by a stuff byte
+            payload_end = -3 if recv_checksum in STUFF_CODES and data[-3] == PDI_STF else -2
+            payload = data[1:payload_end]
+            self._data = self._unstuff(payload)
+            if recv_checksum != self._checksum(payload):
                 raise ValueError(f"Invalid PDI Request: {data}  [BAD CHECKSUM]")
             self._pdi_command: PdiCommand = PdiCommand(data[1])
         else:
@@ -52,26 +82,48 @@ class PdiReq(ABC):
         return f"[PDI {self._pdi_command.friendly}{data}]"
 
     @staticmethod
-    def _calculate_checksum(data: bytes, add_stf=True) -> Tuple[bytes, bytes]:
-        byte_stream = bytes()
-        check_sum = 0
-        for b in data:
-            check_sum += b
-            if b in [PDI_SOP, PDI_STF, PDI_EOP]:
-                check_sum += PDI_STF
-                if add_stf is True:
-                    byte_stream += PDI_STF.to_bytes(1, byteorder='big')
-                else:
-                    continue
-            byte_stream += b.to_bytes(1, byteorder='big')
-        # do checksum calculation on buffer
-        check_sum = 0xff & (0 - check_sum)
-        if check_sum in [PDI_SOP, PDI_STF, PDI_EOP]:
-            if add_stf is True:
-                byte_stream += PDI_STF.to_bytes(1, byteorder='big')
-            check_sum += PDI_STF
-            pcheck_sum = 0xff & (0 - check_sum) 
-        return byte_stream, check_sum.to_bytes(1, byteorder='big')
+    def _calculate_checksum(data: bytes | bytearray, add_stf=True) -> Tuple[bytes, int]:
+        """
+            When add_stf is True, data is an outgoing payload; stuff bytes are inserted
+            before any SOP, STF, or EOP bytes, and the checksum is computed over the
+            stuffed result. When False, data is a received (stuffed) payload; the checksum
+            is computed as is, and the stuff bytes are removed from the returned payload
+        """
+        if add_stf is True:
+            byte_stream = PdiReq._stuff(data)
+            check_sum = PdiReq._checksum(byte_stream)
+            if check_sum in STUFF_CODES:
+                byte_stream += STF_BYTE
+        else:
+            check_sum = PdiReq._checksum(data)
+            byte_stream = PdiReq._unstuff(data)
+        return byte_stream, check_sum
+
+    @staticmethod
+    def _stuff(data: bytes | bytearray) -> bytes | bytearray:
+        # stuff the STFs first, so we don't double stuff those we insert
+        return data.replace(STF_BYTE, STUFFED_STF).replace(SOP_BYTE, STUFFED_SOP).replace(EOP_BYTE, STUFFED_EOP)
+
+    @staticmethod
+    def _unstuff(data: bytes | bytearray) -> bytes | bytearray:
+        # every SOP/EOP is preceded by its stuff byte; any STFs that remain are in pairs
+        return data.replace(STUFFED_SOP, SOP_BYTE).replace(STUFFED_EOP, EOP_BYTE).replace(STUFFED_STF, STF_BYTE)
+
+    @staticmethod
+    def _checksum(data: bytes | bytearray) -> int:
+        return 0xff & -sum(data)
+
+    @classmethod
+    def _frame(cls, payload: bytes | bytearray) -> bytes:
+        """
+            Stuff and checksum the payload, and wrap it in SOP/EOP bytes
+        """
+        payload, checksum = cls._calculate_checksum(payload)
+        frame = bytearray(SOP_BYTE)
+        frame += payload
+        frame.append(checksum)
+        frame += EOP_BYTE
+        return bytes(frame)
 
     @property
     def pdi_command(self) -> PdiCommand:
@@ -97,27 +149,38 @@ class PdiReq(ABC):
 
     @property
     def as_bytes(self) -> bytes:
+        """
+            Requests don't change once built, so serialize them only once
+        """
+        if self._as_bytes is None:
+            self._as_bytes = self._build_bytes()
+        return self._as_bytes
+
+    def _build_bytes(self) -> bytes:
         """
             Default implementation, should override in more complex requests
         """
-        byte_str = self.pdi_command.as_bytes
-        byte_str += self.tmcc_id.to_bytes(1, byteorder='big')
-        byte_str += CommonAction.CONFIG.as_bytes
-        byte_str, checksum = self._calculate_checksum(byte_str)
-        byte_str = PDI_SOP.to_bytes(1, byteorder='big') + byte_str
-        byte_str += checksum
-        byte_str += PDI_EOP.to_bytes(1, byteorder='big')
-        return byte_str
+        byte_str = bytearray((self.pdi_command, self.tmcc_id, CommonAction.CONFIG.bits))
+        return self._frame(byte_str)
+
+    @property
+    def topic_keys(self) -> Tuple:
+        """
+            The channels this request is published on, most specific first.
+            Built once, so the dispatcher doesn't rebuild the tuples per publish
+        """
+        if self._topic_keys is None:
+            scope = self.scope
+            tmcc_id = self.tmcc_id
+            self._topic_keys = ((scope, tmcc_id, self.action), (scope, tmcc_id), scope)
+        return self._topic_keys
 
     @property
     def checksum(self) -> bytes:
-        check_sum = 0
-        for b in self._data:
-            if b in [PDI_SOP, PDI_EOP]:
-                continue
-            check_sum += b
-        check_sum = 0xFF & (0 - check_sum)
-        return check_sum.to_bytes(1)
+        # SOP and EOP bytes don't count toward the checksum
+        data = self._data
+        check_sum = sum(data) - PDI_SOP * data.count(PDI_SOP) - PDI_EOP * data.count(PDI_EOP)
+        return (0xFF & -check_sum).to_bytes(1)
 
     @property
     def is_ping(self) -> bool:
@@ -230,16 +293,9 @@ class LcsReq(PdiReq, ABC):
     def ident(self) -> int:
         return self._ident
 
-    @property
-    def as_bytes(self) -> bytes:
-        byte_str = self.pdi_command.as_bytes
-        byte_str += self.tmcc_id.to_bytes(1, byteorder='big')
-        byte_str += self.action.as_bytes
-        byte_str, checksum = self._calculate_checksum(byte_str)
-        byte_str = PDI_SOP.to_bytes(1, byteorder='big') + byte_str
-        byte_str += checksum
-        byte_str += PDI_EOP.to_bytes(1, byteorder='big')
-        return byte_str
+    def _build_bytes(self) -> bytes:
+        byte_str = bytearray((self.pdi_command, self.tmcc_id, self.action.bits))
+        return self._frame(byte_str)
 
     @property
     def payload(self) -> str | None:
@@ -324,12 +380,13 @@ class TmccReq(PdiReq):
 
     @property
     def as_bytes(self) -> bytes:
-        byte_str = self.pdi_command.as_bytes + self.tmcc_command.as_bytes
-        byte_str, checksum = self._calculate_checksum(byte_str)
-        byte_str = PDI_SOP.to_bytes(1, byteorder='big') + byte_str
-        byte_str += checksum
-        byte_str += PDI_EOP.to_bytes(1, byteorder='big')
-        return byte_str
+        # the wrapped CommandReq is mutable, so don't cache
+        return self._build_bytes()
+
+    def _build_bytes(self) -> bytes:
+        byte_str = bytearray((self.pdi_command,))
+        byte_str += self.tmcc_command.as_bytes
+        return self._frame(byte_str)
 
     @property
     def scope(self) -> CommandScope:
@@ -380,14 +437,8 @@ class PingReq(PdiReq):
             if PdiCommand(data[1]).is_ping is False:
                 raise ValueError(f"Invalid PDI Ping Request: {data}")
 
-    @property
-    def as_bytes(self) -> bytes:
-        byte_str = self.pdi_command.as_bytes
-        byte_str, checksum = self._calculate_checksum(byte_str)
-        byte_str = PDI_SOP.to_bytes(1, byteorder='big') + byte_str
-        byte_str += checksum
-        byte_str += PDI_EOP.to_bytes(1, byteorder='big')
-        return byte_str
+    def _build_bytes(self) -> bytes:
+        return PING_FRAME
 
     @property
     def scope(self) -> CommandScope:
@@ -397,6 +448,9 @@ class PingReq(PdiReq):
         return f"[PDI {self._pdi_command.friendly}]"
 
 
+PING_FRAME: bytes = PdiReq._frame(PdiCommand.PING.as_bytes)  # pings never vary, so frame them once
+
+
 class DeviceWrapper:
     C = TypeVar('C', bound=PdiReq.__class__)
     E = TypeVar('E', bound=Enum)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import abc
-import math
 from abc import ABC
 from enum import Enum
 from typing import Dict, Any, Self, Tuple
@@ -15,6 +14,8 @@ class CommandDef(ABC):
         Marker class for TMCC1 and TMCC2 Command Defs, allowing the CLI layer
         to work with them in a command format agnostic manner.
     """
+    __slots__ = ('_command_bits', '_is_addressable', '_num_address_bits', '_do_reverse_lookup', '_alias', '_data',
+                 '_d_min', '_d_max', '_d_map', '_d_offset', '_d_bits', '_data_bits', '_data_mask')
 
     def __init__(self,
                  command_bits: int,
@@ -37,9 +38,22 @@ class CommandDef(ABC):
         self._d_map = d_map
         self._d_bits = 0
         if d_max:
-            self._d_bits = math.ceil(math.log2(d_max))
+            self._d_bits = d_max.bit_length()
         elif d_map is not None:
-            self._d_bits = math.ceil(math.log2(max(d_map.values())))
+            self._d_bits = max(d_map.values()).bit_length()
+        # masks are fixed per command, so compute them once
+        self._data_bits = (1 << self._d_bits) - 1
+        self._data_mask = 0xFFFF & ~self._data_bits
+        # maps that just shift a contiguous range of values, such as RELATIVE_SPEED_MAP,
+        # are applied as an offset, with their keys setting the valid data range
+        self._d_offset = None
+        if d_map:
+            lo, hi = min(d_map), max(d_map)
+            offset = d_map[lo] - lo
+            if len(d_map) == hi - lo + 1 and all(v - k == offset for k, v in d_map.items()):
+                self._d_offset = offset
+                self._d_min = lo
+                self._d_max = hi
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__} 0x{self.bits:04x}: {self.num_data_bits} data bits"
@@ -81,7 +95,11 @@ class CommandDef(ABC):
         if self.is_data:
             value = int.from_bytes(byte_data, byteorder='big')
             data = 0xFFFF & (~self.data_mask & value)
-            if self.data_map:
+            if self._d_offset is not None:
+                data -= self._d_offset
+                if self._d_min <= data <= self._d_max:
+                    return data
+            elif self.data_map:
                 for k, v in self.data_map.items():
                     if v == data:
                         return k
@@ -104,9 +122,13 @@ class CommandDef(ABC):
         else:
             return 0
 
+    @property
+    def data_bits(self) -> int:
+        return self._data_bits
+
     @property
     def data_mask(self) -> int:
-        return 0xFFFF & ~(2 ** self.num_data_bits - 1)
+        return self._data_mask
 
     @property
     def data_min(self) -> int:
@@ -120,6 +142,10 @@ class CommandDef(ABC):
     def data_map(self) -> Dict[int, int] | None:
         return self._d_map
 
+    @property
+    def data_offset(self) -> int | None:
+        return self._d_offset
+
     @property
     def syntax(self) -> CommandSyntax:
         raise TypeError(f"Invalid command syntax: {self}")
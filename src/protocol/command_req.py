@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from typing import Callable, Self
+from typing import Callable, Self, Tuple
 
 from .constants import DEFAULT_ADDRESS, DEFAULT_BAUDRATE, DEFAULT_PORT
 from .constants import CommandScope, CommandSyntax
-from .tmcc2.tmcc2_constants import TMCC2Enum, TMCC2CommandPrefix, LEGACY_ENGINE_COMMAND_PREFIX
-from .tmcc2.tmcc2_constants import TMCC2RouteCommandDef, TMCC2HaltCommandDef, TMCC2EngineCommandDef
+from .tmcc2.tmcc2_constants import TMCC2Enum, LEGACY_ENGINE_COMMAND_PREFIX
+from .tmcc2.tmcc2_constants import TMCC2HaltCommandDef, TMCC2EngineCommandDef, TMCC2_COMMAND_BITS_TO_ENUM
 from .tmcc2.tmcc2_constants import LEGACY_TRAIN_COMMAND_PREFIX, LEGACY_EXTENDED_BLOCK_COMMAND_PREFIX
 from .tmcc2.tmcc2_constants import TMCC2CommandDef
 from .command_def import CommandDef, CommandDefEnum
-from .tmcc1.tmcc1_constants import TMCC1CommandDef, TMCC1_COMMAND_PREFIX, TMCC1Enum
+from .tmcc1.tmcc1_constants import TMCC1CommandDef, TMCC1_COMMAND_PREFIX, TMCC1_COMMAND_PREFIX_BYTES, TMCC1Enum
 from .tmcc1.tmcc1_constants import TMCC1HaltCommandDef, TMCC1SwitchState, TMCC1AuxCommandDef, TMCC1EngineCommandDef
 from .tmcc1.tmcc1_constants import TMCC1CommandIdentifier, TMCC1_TRAIN_COMMAND_PURIFIER
 from .tmcc1.tmcc1_constants import TMCC1_TRAIN_COMMAND_MODIFIER
@@ -92,10 +92,10 @@ class CommandReq:
         # otherwise, we need to figure out if we're returning a
         # TMCC1-style or TMCC2-style command prefix
         if isinstance(command, TMCC1CommandDef):
-            return TMCC1_COMMAND_PREFIX.to_bytes(1, byteorder='big')
+            return TMCC1_COMMAND_PREFIX_BYTES
         elif isinstance(command, TMCC2CommandDef):
             validated_scope = cls._validate_requested_scope(command, scope)
-            return TMCC2CommandPrefix(validated_scope.name).as_bytes
+            return TMCC2CommandDef.scope_first_byte(validated_scope)
         raise TypeError(f"Command type not recognized {command}")
 
     @classmethod
@@ -175,6 +175,8 @@ class CommandReq:
         self._scope = self._validate_requested_scope(self._command_def, scope)
         self._buffer: CommBuffer | None = None
         self._message_processor = None
+        self._actions: dict[tuple, Tuple[CommBuffer, Callable]] = {}
+        self._first_byte: bytes | None = None  # command def and scope are fixed, so resolved once, on first use
 
         # save the command bits from the def, as we will be modifying them
         self._command_bits: int = self._command_def.bits
@@ -296,10 +298,13 @@ class CommandReq:
 
     @property
     def as_bytes(self) -> bytes:
-        if self.scope is None:
-            first_byte = self.command_def.first_byte
-        else:
-            first_byte = self._determine_first_byte(self.command_def, self.scope)
+        first_byte = self._first_byte
+        if first_byte is None:
+            if self.scope is None:
+                first_byte = self.command_def.first_byte
+            else:
+                first_byte = self._determine_first_byte(self.command_def, self.scope)
+            self._first_byte = first_byte
         return first_byte + self._command_bits.to_bytes(2, byteorder='big')
 
     def as_action(self,
@@ -309,8 +314,26 @@ class CommandReq:
                   port: str = DEFAULT_PORT,
                   server: str = None
                   ) -> Callable:
+        """
+            Return a function that sends this request when called. Actions are cached
+            per request and argument set, and are rebuilt if the CommBuffer changes
+        """
         buffer = CommBuffer.build(baudrate=baudrate, port=port, server=server)
-
+        key = (repeat, delay, baudrate, port, server)
+        cached = self._actions.get(key)
+        if cached is not None and cached[0] is buffer:
+            return cached[1]
+        action = self._make_action(repeat, delay, baudrate, port, server, buffer)
+        self._actions[key] = (buffer, action)
+        return action
+
+    def _make_action(self,
+                     repeat: int,
+                     delay: float,
+                     baudrate: int,
+                     port: str,
+                     server: str | None,
+                     buffer: CommBuffer) -> Callable:
         def send_func(new_address: int = None, new_data: int = None) -> None:
             if new_address and new_address != self.address:
                 self.address = new_address
@@ -351,24 +374,27 @@ class CommandReq:
             set to send to the Lionel LCS SER2.
         """
         data = new_data if new_data is not None else self.data
-        if self.num_data_bits and data is None:
-            raise ValueError("Data is required")
-        if self.num_data_bits == 0:
+        cd = self._command_def  # fixed for the life of the request, so resolve it once
+        if cd.num_data_bits == 0:
             return self.bits
-        elif self.command_def.data_map:
-            if data in self.command_def.data_map:
-                data = self.command_def.data_map[data]
+        elif data is None:
+            raise ValueError("Data is required")
+        elif cd.data_offset is not None:
+            if data < cd.data_min or data > cd.data_max:
+                raise ValueError(f"Invalid data value: {data} (not in map)")
+            data += cd.data_offset
+        elif cd.data_map:
+            if data in cd.data_map:
+                data = cd.data_map[data]
             else:
                 raise ValueError(f"Invalid data value: {data} (not in map)")
-        elif data < self.command_def.data_min or data > self.command_def.data_max:
+        elif data < cd.data_min or data > cd.data_max:
             raise ValueError(f"Invalid data value: {data} (not in range)")
         # sanitize data so we don't set bits we shouldn't
-        data_bits = (2 ** self.num_data_bits - 1)
-        filtered_data = data & data_bits
-        if data != filtered_data:
+        if data & ~cd.data_bits:
             raise ValueError(f"Invalid data value: {data} (not in range)")
         # clear out old data
-        self._command_bits &= 0xFFFF & ~data_bits
+        self._command_bits &= cd.data_mask
         # set new data
         self._command_bits |= data
         return self._command_bits
@@ -401,19 +427,15 @@ class CommandReq:
     def build_tmcc2_command_req(cls, param):
         if len(param) == 3:
             value = int.from_bytes(param[1:3], byteorder='big')
-            for tmcc_enum in [TMCC2HaltCommandDef,
-                              TMCC2EngineCommandDef,
-                              TMCC2RouteCommandDef]:
-
-                cmd_enum = tmcc_enum.by_value(value)
-                if cmd_enum is not None:
-                    scope = cmd_enum.scope
-                    if int(param[0]) == LEGACY_TRAIN_COMMAND_PREFIX:
-                        scope = CommandScope.TRAIN
-                    # build the request and return
-                    data = cmd_enum.value.data_from_bytes(param[1:3])
-                    address = cmd_enum.value.address_from_bytes(param[1:3])
-                    return CommandReq.build(cmd_enum, address, data, scope)
+            cmd_enum = TMCC2_COMMAND_BITS_TO_ENUM[value & 0x1FF]
+            if cmd_enum is not None:
+                scope = cmd_enum.scope
+                if int(param[0]) == LEGACY_TRAIN_COMMAND_PREFIX:
+                    scope = CommandScope.TRAIN
+                # build the request and return
+                data = cmd_enum.value.data_from_bytes(param[1:3])
+                address = cmd_enum.value.address_from_bytes(param[1:3])
+                return CommandReq.build(cmd_enum, address, data, scope)
             raise ValueError(f"Invalid tmcc2 command: : {param.hex(':')}")
         else:
             from src.protocol.tmcc2.param_command_req import ParameterCommandReq
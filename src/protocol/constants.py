@@ -17,6 +17,8 @@ DEFAULT_SERVER_PORT: int = 5110  # unassigned by IANA as of 9/16/2024
 
 DEFAULT_QUEUE_SIZE: int = 2**11  # 2,048 entries
 
+DEFAULT_RECV_SIZE: int = 2**16  # 64 KiB socket reads
+
 DEFAULT_THROTTLE_DELAY: int = 50  # milliseconds
 
 
@@ -24,6 +26,10 @@ class Mixins(Enum):
     """
         Common mixins we want all PyLegacy enums to support
     """
+    # members are singletons, so hash by identity in C rather than through Enum.__hash__;
+    # int-valued enums that list Mixins ahead of IntEnum must restore int.__hash__
+    __hash__ = object.__hash__
+
     @classmethod
     def by_name(cls, name: str, raise_exception: bool = False) -> Self | None:
         if name is None:
@@ -31,21 +37,31 @@ class Mixins(Enum):
                 raise ValueError(f"None is not a valid {cls.__name__}")
             else:
                 return None
-        orig_name = name = name.strip()
-        if name in cls.__members__:
-            return cls[name]
-        # fall back to case-insensitive s
-        name = name.lower()
-        for k, v in cls.__members__.items():
-            if k.lower() == name:
-                return v
+        name = name.strip()
+        member = cls.__members__.get(name)
+        if member is None:
+            # fall back to case-insensitive search
+            member = cls._lc_members().get(name.lower())
+        if member is not None or not raise_exception:
+            return member
+        if name:
+            raise ValueError(f"'{name}' is not a valid {cls.__name__}")
         else:
-            if not raise_exception:
-                return None
-            if name:
-                raise ValueError(f"'{orig_name}' is not a valid {cls.__name__}")
-            else:
-                raise ValueError(f"None/Empty is not a valid {cls.__name__}")
+            raise ValueError(f"None/Empty is not a valid {cls.__name__}")
+
+    @classmethod
+    def _lc_members(cls) -> dict[str, Self]:
+        """
+            Members keyed by their lower-cased names, built on first use
+        """
+        try:
+            return cls.__dict__['_lc_members_map']
+        except KeyError:
+            lc_members = {}
+            for k, v in cls.__members__.items():
+                lc_members.setdefault(k.lower(), v)
+            setattr(cls, '_lc_members_map', lc_members)
+            return lc_members
 
     @classmethod
     def by_value(cls, value: Any, raise_exception: bool = False) -> Self | None:
@@ -62,9 +78,10 @@ class Mixins(Enum):
     @classmethod
     def _missing_(cls, value) -> Self:
         if type(value) is str:
-            value = str(value).upper()
-            if value in dir(cls):
-                return cls[value]
+            value = value.upper()
+            member = cls.__members__.get(value)
+            if member is not None:
+                return member
         elif type(value) is int:
             return cls.by_value(value, raise_exception=True)
         raise ValueError(f"{value} is not a valid {cls.__name__}")
@@ -100,6 +117,8 @@ class CommandPrefix(Mixins, IntEnum):
     """
         Marker interface for Command Prefix enums
     """
+    __hash__ = int.__hash__
+
     @property
     def prefix(self) -> Self:
         return self
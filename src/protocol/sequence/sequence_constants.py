@@ -12,6 +12,7 @@ from ..tmcc2.tmcc2_constants import TMCC2CommandDef
 
 class SequenceDef(TMCC2CommandDef):
     from .sequence_req import SequenceReq
+    __slots__ = ('_cmd_class',)
 
     def __init__(self,
                  command_bits: int,
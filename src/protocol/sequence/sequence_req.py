@@ -94,15 +94,13 @@ class SequenceReq(CommandReq, Sequence):
         self.send(repeat, delay, baudrate, port, server)
         CommBuffer.build().shutdown()
 
-    def as_action(self,
-                  repeat: int = 1,
-                  delay: float = 0,
-                  baudrate: int = DEFAULT_BAUDRATE,
-                  port: str = DEFAULT_PORT,
-                  server: str = None
-                  ) -> Callable:
-        buffer = CommBuffer.build(baudrate=baudrate, port=port, server=server)
-
+    def _make_action(self,
+                     repeat: int,
+                     delay: float,
+                     baudrate: int,
+                     port: str,
+                     server: str | None,
+                     buffer: CommBuffer) -> Callable:
         def send_func(new_address: int = None) -> None:
             for sq_request in self._requests:
                 request = sq_request.request
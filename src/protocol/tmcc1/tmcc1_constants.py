@@ -5,7 +5,8 @@ from __future__ import annotations
 
 import abc
 from enum import verify, UNIQUE
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Dict, Tuple, Mapping
 
 from ..command_def import CommandDef, CommandDefEnum
 from ..constants import CommandPrefix, CommandScope, CommandSyntax
@@ -23,6 +24,7 @@ class TMCC1Enum(CommandDefEnum):
     TMCC1 Protocol Constants
 """
 TMCC1_COMMAND_PREFIX: int = 0xFE
+TMCC1_COMMAND_PREFIX_BYTES: bytes = TMCC1_COMMAND_PREFIX.to_bytes(1, byteorder='big')
 
 
 @verify(UNIQUE)
@@ -54,18 +56,19 @@ class TMCC1CommandIdentifier(CommandPrefix):
         raise ValueError(f"Cannot classify {byte_data.hex(':')}")
 
 
-TMCC1_IDENT_TO_SCOPE_MAP: Dict[TMCC1CommandIdentifier, CommandScope] = {
+TMCC1_IDENT_TO_SCOPE_MAP: Mapping[TMCC1CommandIdentifier, CommandScope] = MappingProxyType({
     TMCC1CommandIdentifier.ENGINE: CommandScope.ENGINE,
     TMCC1CommandIdentifier.TRAIN: CommandScope.TRAIN,
     TMCC1CommandIdentifier.SWITCH: CommandScope.SWITCH,
     TMCC1CommandIdentifier.ACC: CommandScope.ACC,
     TMCC1CommandIdentifier.ROUTE: CommandScope.ROUTE,
     TMCC1CommandIdentifier.HALT: CommandScope.SYSTEM,
-}
+})
 
 
 class TMCC1CommandDef(CommandDef):
     __metaclass__ = abc.ABCMeta
+    __slots__ = ('_command_ident', '_scope', '_address_mask')
 
     def __init__(self,
                  command_bits: int,
@@ -88,6 +91,8 @@ class TMCC1CommandDef(CommandDef):
                          alias=alias,
                          data=data)
         self._command_ident = command_ident
+        self._scope = TMCC1_IDENT_TO_SCOPE_MAP[command_ident]  # identifier is fixed, so resolve scope once
+        self._address_mask = 0xFFFF & ~(((1 << self.num_address_bits) - 1) << 7)
 
     @property
     def syntax(self) -> CommandSyntax:
@@ -99,15 +104,15 @@ class TMCC1CommandDef(CommandDef):
 
     @property
     def first_byte(self) -> bytes:
-        return TMCC1_COMMAND_PREFIX.to_bytes(1, byteorder='big')
+        return TMCC1_COMMAND_PREFIX_BYTES
 
     @property
     def scope(self) -> CommandScope:
-        return TMCC1_IDENT_TO_SCOPE_MAP[self.identifier]
+        return self._scope
 
     @property
     def address_mask(self) -> int:
-        return 0xFFFF & ~((2 ** self.num_address_bits - 1) << 7)
+        return self._address_mask
 
     @property
     def train_address_mask(self) -> int:
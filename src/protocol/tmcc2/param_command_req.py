@@ -20,6 +20,13 @@ PARAMETER_ENUM_TO_INDEX_MAP: Dict[TMCC2ParameterEnum, TMCC2ParameterIndex] = {
 
 PARAMETER_INDEX_TO_ENUM_MAP = {s: p for p, s in PARAMETER_ENUM_TO_INDEX_MAP.items()}
 
+# parameter commands indexed by (4-bit parameter index from word #1 << 8) | data byte from word #2
+PARAMETER_INDEX_AND_DATA_TO_ENUM: list[TMCC2ParameterEnum | None] = [None] * 0x1000
+for _pi, _pe in PARAMETER_INDEX_TO_ENUM_MAP.items():
+    for _member in _pe:
+        if PARAMETER_INDEX_AND_DATA_TO_ENUM[_pi << 8 | _member.value.bits] is None:
+            PARAMETER_INDEX_AND_DATA_TO_ENUM[_pi << 8 | _member.value.bits] = _member
+
 
 class ParameterCommandReq(CommandReq):
     @classmethod
@@ -39,23 +46,15 @@ class ParameterCommandReq(CommandReq):
         if (len(param) == 9
                 and param[3] == LEGACY_PARAMETER_COMMAND_PREFIX
                 and param[6] == LEGACY_PARAMETER_COMMAND_PREFIX):
-            index = 0x000F & int.from_bytes(param[1:3], byteorder='big')
-            try:
-                pi = TMCC2ParameterIndex(index)
-            except ValueError:
-                raise ValueError(f"Invalid parameter command: : {param.hex(':')}")
-            if pi in PARAMETER_INDEX_TO_ENUM_MAP:
-                param_enum = PARAMETER_INDEX_TO_ENUM_MAP[pi]
-                command = int(param[5])
-                cmd_enum = param_enum.by_value(command)
-                if cmd_enum is not None:
-                    scope = cmd_enum.scope
-                    if int(param[0]) == LEGACY_TRAIN_COMMAND_PREFIX:
-                        scope = CommandScope.TRAIN
-                    # build the request and return
-                    data = 0
-                    address = cmd_enum.value.address_from_bytes(param[1:3])
-                    return ParameterCommandReq.build(cmd_enum, address, data, scope)
+            cmd_enum = PARAMETER_INDEX_AND_DATA_TO_ENUM[(0x0F & param[2]) << 8 | param[5]]
+            if cmd_enum is not None:
+                scope = cmd_enum.scope
+                if int(param[0]) == LEGACY_TRAIN_COMMAND_PREFIX:
+                    scope = CommandScope.TRAIN
+                # build the request and return
+                data = 0
+                address = cmd_enum.value.address_from_bytes(param[1:3])
+                return ParameterCommandReq.build(cmd_enum, address, data, scope)
         raise ValueError(f"Invalid parameter command: : {param.hex(':')}")
 
     def __init__(self,
@@ -1,4 +1,3 @@
-import abc
 from enum import verify, UNIQUE, IntEnum
 
 from src.protocol.command_def import Mixins, CommandDefEnum
@@ -32,6 +31,8 @@ TMCC2_VARIABLE_LENGTH_COMMAND_PARAMETER_INDEX: int = 0x0F
 
 @verify(UNIQUE)
 class TMCC2ParameterIndex(Mixins, IntEnum):
+    __hash__ = int.__hash__
+
     PARAMETER_ASSIGNMENT = TMCC2_PARAMETER_ASSIGNMENT_PARAMETER_INDEX
     DIALOG_TRIGGERS = TMCC2_RAIL_SOUNDS_DIALOG_TRIGGERS_PARAMETER_INDEX
     EFFECTS_TRIGGERS = TMCC2_RAIL_SOUNDS_EFFECTS_TRIGGERS_PARAMETER_INDEX
@@ -42,11 +43,11 @@ class TMCC2ParameterIndex(Mixins, IntEnum):
 
 
 class TMCC2ParameterCommandDef(TMCC2CommandDef):
-    __metaclass__ = abc.ABCMeta
+    __slots__ = ()
+    _first_byte = TMCC2CommandPrefix.ENGINE  # the same for every parameter command
 
     def __init__(self, command_bits: int) -> None:
         super().__init__(command_bits)
-        self._first_byte = TMCC2CommandPrefix.ENGINE
 
 
 class TMCC2ParameterData(CommandDefEnum):
@@ -50,9 +50,14 @@ TMCC2_FIRST_BYTE_TO_SCOPE_MAP = {
 
 TMCC2_SCOPE_TO_FIRST_BYTE_MAP = {s: p for p, s in TMCC2_FIRST_BYTE_TO_SCOPE_MAP.items()}
 
+# first byte of each scope, indexed by CommandScope value; 0x00 marks scopes with no TMCC2 prefix
+TMCC2_SCOPE_TO_FIRST_BYTE: bytes = bytes(TMCC2_SCOPE_TO_FIRST_BYTE_MAP.get(CommandScope(v), 0) if v else 0
+                                         for v in range(max(s.value for s in CommandScope) + 1))
+
 
 class TMCC2CommandDef(CommandDef):
     __metaclass__ = abc.ABCMeta
+    __slots__ = ('_scope', '_address_mask')
 
     def __init__(self,
                  command_bits: int,
@@ -65,10 +70,18 @@ class TMCC2CommandDef(CommandDef):
                  data: int = None) -> None:
         super().__init__(command_bits, is_addressable, d_min=d_min, d_max=d_max, d_map=d_map, alias=alias, data=data)
         self._scope = scope
+        self._address_mask = 0xFFFF & ~(((1 << self.num_address_bits) - 1) << 9)
+
+    @staticmethod
+    def scope_first_byte(scope: CommandScope) -> bytes:
+        first_byte = TMCC2_SCOPE_TO_FIRST_BYTE[scope.value:scope.value + 1]
+        if first_byte == b'\x00':
+            raise ValueError(f"No TMCC2 command prefix for scope: {scope.name}")
+        return first_byte
 
     @property
     def first_byte(self) -> bytes:
-        return TMCC2_SCOPE_TO_FIRST_BYTE_MAP[self.scope].to_bytes(1, byteorder='big')
+        return self.scope_first_byte(self._scope)
 
     @property
     def scope(self) -> CommandScope:
@@ -80,7 +93,7 @@ class TMCC2CommandDef(CommandDef):
 
     @property
     def address_mask(self) -> int:
-        return 0xFFFF & ~((2 ** self.num_address_bits - 1) << 9)
+        return self._address_mask
 
     def address_from_bytes(self, byte_data: bytes) -> int:
         if self.is_addressable:
@@ -296,3 +309,19 @@ for tmcc2_enum in [TMCC2EngineCommandDef, TMCC2HaltCommandDef, TMCC2RouteCommand
     for enum in tmcc2_enum:
         if enum.is_alias:
             TMCC2_COMMAND_TO_ALIAS_MAP[enum.alias] = enum
+
+# map the low nine bits of a TMCC2 command word (command + data) to the enum it decodes to;
+# all TMCC2 commands carry their address in the upper seven bits, so those are ignored
+TMCC2_COMMAND_BITS_TO_ENUM: list[TMCC2Enum | None] = [None] * 0x200
+for tmcc2_enum in [TMCC2HaltCommandDef, TMCC2EngineCommandDef, TMCC2RouteCommandDef]:
+    for enum in tmcc2_enum:
+        if enum.is_alias:
+            continue
+        cd = enum.command_def
+        if cd.is_data:
+            data_values = cd.data_map.values() if cd.data_map else range(cd.data_min, cd.data_max + 1)
+        else:
+            data_values = [0]
+        for data_value in data_values:
+            if TMCC2_COMMAND_BITS_TO_ENUM[cd.bits | data_value] is None:
+                TMCC2_COMMAND_BITS_TO_ENUM[cd.bits | data_value] = enum
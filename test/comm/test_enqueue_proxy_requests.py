@@ -0,0 +1,48 @@
+import socket
+
+# noinspection PyPackageRequirements
+import pytest
+
+from src.comm.enqueue_proxy_requests import EnqueueProxyRequests
+from test.test_base import TestBase
+
+
+@pytest.fixture(autouse=True)
+def run_before_and_after_tests(tmpdir) -> None:
+    """
+        Fixture to execute asserts before and after a test is run
+    """
+    yield  # this is where the testing happens
+
+    # Teardown
+    EnqueueProxyRequests.stop()
+    assert EnqueueProxyRequests.is_built() is False
+
+
+class TestEnqueueProxyRequests(TestBase):
+    def test_bind_failure_leaves_no_singleton(self) -> None:
+        # hold a port open, so the server can't bind to it
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('', 0))
+            sock.listen()
+            port = sock.getsockname()[1]
+            with pytest.raises(OSError):
+                EnqueueProxyRequests.build(None, port)
+            assert EnqueueProxyRequests.is_built() is False
+            assert EnqueueProxyRequests.clients() == ()
+            assert EnqueueProxyRequests.has_client('127.0.0.1') is False
+
+    def test_clients_after_shutdown(self) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('', 0))
+            port = sock.getsockname()[1]
+        server = EnqueueProxyRequests.build(None, port)
+        assert EnqueueProxyRequests.is_built() is True
+        EnqueueProxyRequests.note_client_addr('127.0.0.1')
+        assert EnqueueProxyRequests.clients() == ('127.0.0.1',)
+        assert EnqueueProxyRequests.has_client('127.0.0.1') is True
+
+        server.shutdown()
+        assert EnqueueProxyRequests.is_built() is False
+        assert EnqueueProxyRequests.clients() == ()
+        assert EnqueueProxyRequests.has_client('127.0.0.1') is False
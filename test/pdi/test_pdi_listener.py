@@ -0,0 +1,106 @@
+from unittest import mock
+
+# noinspection PyPackageRequirements
+import pytest
+
+from src.comm.enqueue_proxy_requests import EnqueueProxyRequests
+
+from src.comm.command_listener import CommandDispatcher, Message
+from src.pdi.constants import PDI_SOP, PDI_STF, PDI_EOP
+# noinspection PyProtectedMember
+from src.pdi.pdi_listener import PdiListener, PdiDispatcher
+from src.protocol.constants import CommandScope, BROADCAST_TOPIC
+from test.test_base import TestBase
+
+
+@pytest.fixture(autouse=True)
+def run_before_and_after_tests(tmpdir) -> None:
+    """
+        Fixture to execute asserts before and after a test is run
+    """
+    yield  # this is where the testing happens
+
+    # Teardown
+    if PdiDispatcher.is_built:
+        PdiDispatcher().shutdown()
+    assert PdiDispatcher.is_built is False
+    if CommandDispatcher.is_built:
+        CommandDispatcher().shutdown()
+    assert CommandDispatcher.is_built is False
+
+
+# noinspection PyMethodMayBeStatic
+class TestPdiListener(TestBase):
+    def test_next_packet(self) -> None:
+        packet = bytes([PDI_SOP, 0x27, 0x29, PDI_EOP])
+        buffer = bytearray(packet)
+        assert PdiListener._next_packet(buffer) == packet
+        assert len(buffer) == 0
+        assert PdiListener._next_packet(buffer) is None
+
+        # leading garbage is discarded
+        buffer = bytearray(b'\x01\x02' + packet + packet)
+        assert PdiListener._next_packet(buffer) == packet
+        assert PdiListener._next_packet(buffer) == packet
+        assert len(buffer) == 0
+
+        # partial packets are left in the buffer
+        buffer = bytearray(packet[:3])
+        assert PdiListener._next_packet(buffer) is None
+        assert buffer == bytearray(packet[:3])
+        buffer += packet[3:]
+        assert PdiListener._next_packet(buffer) == packet
+
+    def test_next_packet_stuffed_eop(self) -> None:
+        # a stuffed EOP is part of the payload
+        packet = bytes([PDI_SOP, 0x27, PDI_STF, PDI_EOP, 0x29, PDI_EOP])
+        buffer = bytearray(packet)
+        assert PdiListener._next_packet(buffer) == packet
+        assert PdiListener._next_packet(bytearray(packet[:4])) is None
+
+        # a stuffed STF followed by an EOP ends the packet
+        packet = bytes([PDI_SOP, 0x27, PDI_STF, PDI_STF, PDI_EOP])
+        buffer = bytearray(packet + b'\x01')
+        assert PdiListener._next_packet(buffer) == packet
+        assert buffer == bytearray(b'\x01')
+
+
+# noinspection PyMethodMayBeStatic
+class TestPdiDispatcher(TestBase):
+    def __call__(self, message: Message) -> None:
+        pass
+
+    def test_channels(self) -> None:
+        dispatcher = PdiDispatcher()
+        assert isinstance(dispatcher._channels, dict)
+        assert not dispatcher._channels
+
+        # publishing to a topic no one subscribes to doesn't create a channel
+        dispatcher.publish(CommandScope.SWITCH, None)
+        assert not dispatcher._channels
+
+        dispatcher.subscribe(self, CommandScope.SWITCH)
+        dispatcher.subscribe(self, CommandScope.SWITCH, 5)
+        assert len(dispatcher._channels) == 2
+        dispatcher.unsubscribe(self, CommandScope.SWITCH, 5)
+        assert len(dispatcher._channels) == 1
+        dispatcher.unsubscribe(self, CommandScope.SWITCH, 5)  # no longer subscribed
+        assert len(dispatcher._channels) == 1
+        dispatcher.unsubscribe(self, CommandScope.SWITCH)
+        assert not dispatcher._channels
+
+        dispatcher.subscribe_any(self)
+        assert dispatcher.broadcasts_enabled is True
+        dispatcher.unsubscribe(self, BROADCAST_TOPIC)
+        assert dispatcher.broadcasts_enabled is False
+        assert not dispatcher._channels
+
+    def test_flush_client_state_after_shutdown(self) -> None:
+        dispatcher = PdiDispatcher()
+        with mock.patch.object(EnqueueProxyRequests, 'clients', return_value=('127.0.0.1',)):
+            dispatcher._client_updates += b'\xd1\x01\xdf'
+            dispatcher._num_client_updates = 1
+            dispatcher.shutdown()
+            # sender threads are gone after shutdown, so nothing is submitted, and nothing raises
+            dispatcher.flush_client_state()
+            assert not dispatcher._client_senders
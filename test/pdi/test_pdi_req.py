@@ -0,0 +1,57 @@
+import pytest
+
+from src.pdi.constants import PDI_SOP, PDI_STF, PDI_EOP, PdiCommand
+from src.pdi.pdi_req import PdiReq, PingReq, PING_FRAME
+from test.test_base import TestBase
+
+
+# noinspection PyMethodMayBeStatic
+class TestPdiReq(TestBase):
+    def test_calculate_checksum(self) -> None:
+        data = bytes([0x27, 0x01, 0x02])
+        stuffed, checksum = PdiReq._calculate_checksum(data)
+        assert stuffed == data
+        assert checksum == 0xff & -sum(data)
+        unstuffed, recv_checksum = PdiReq._calculate_checksum(stuffed, False)
+        assert unstuffed == data
+        assert recv_checksum == checksum
+
+    def test_calculate_checksum_stuffing(self) -> None:
+        data = bytes([0x27, PDI_SOP, PDI_STF, PDI_EOP, PDI_STF, PDI_STF, PDI_SOP, 0x01])
+        stuffed, checksum = PdiReq._calculate_checksum(data)
+        assert stuffed == bytes([0x27,
+                                 PDI_STF, PDI_SOP,
+                                 PDI_STF, PDI_STF,
+                                 PDI_STF, PDI_EOP,
+                                 PDI_STF, PDI_STF,
+                                 PDI_STF, PDI_STF,
+                                 PDI_STF, PDI_SOP,
+                                 0x01])
+        # checksum covers the stuffed payload
+        assert checksum == 0xff & -sum(stuffed)
+        assert PdiReq._checksum(stuffed) == checksum
+        assert PdiReq._unstuff(stuffed) == data
+        unstuffed, recv_checksum = PdiReq._calculate_checksum(stuffed, False)
+        assert unstuffed == data
+        assert recv_checksum == checksum
+
+    def test_ping_round_trip(self) -> None:
+        ping = PingReq()
+        packet = ping.as_bytes
+        assert packet is PING_FRAME  # all pings share one frame
+        assert packet[0] == PDI_SOP
+        assert packet[-1] == PDI_EOP
+        req = PdiReq.from_bytes(packet)
+        assert isinstance(req, PingReq)
+        assert req.pdi_command == PdiCommand.PING
+        assert req.as_bytes == packet
+
+    def test_from_bytes_dispatch(self) -> None:
+        req_classes = PdiReq._req_class_map()
+        assert req_classes[PdiCommand.PING] is PingReq
+        for pdi_cmd in PdiCommand:
+            if pdi_cmd in req_classes:
+                assert issubclass(req_classes[pdi_cmd], PdiReq)
+        # unknown command bytes are rejected
+        with pytest.raises(ValueError):
+            PdiReq.from_bytes(bytes([PDI_SOP, 0xff, 0x00, PDI_EOP]))
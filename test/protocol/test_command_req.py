@@ -12,6 +12,7 @@ from src.protocol.tmcc1.tmcc1_constants import *
 from src.protocol.tmcc2.tmcc2_constants import *
 from src.protocol.tmcc2.param_constants import *
 from src.protocol.command_req import CommandReq
+from src.protocol.tmcc2.param_command_req import PARAMETER_INDEX_TO_ENUM_MAP, PARAMETER_INDEX_AND_DATA_TO_ENUM
 from src.protocol.constants import *
 
 
@@ -161,6 +162,15 @@ class TestCommandReq(TestBase):
                 assert mk_comm_enqueue_command.call_count == 3
                 mk_comm_enqueue_command.reset_mock()
 
+    def test_as_action_cached(self):
+        req = CommandReq.build(TMCC2EngineCommandDef.RING_BELL, 1)
+        action = req.as_action()
+        assert req.as_action() is action
+        assert req.as_action(repeat=2) is not action
+        assert req.as_action(repeat=2) is req.as_action(repeat=2)
+        # actions are not shared between requests
+        assert CommandReq.build(TMCC2EngineCommandDef.RING_BELL, 1).as_action() is not action
+
     def test__determine_first_byte(self):
         for cdef in self.all_command_enums:
             for cmd in cdef:
@@ -221,6 +231,17 @@ class TestCommandReq(TestBase):
                 req = self.build_request(cmd, 1, data)
                 assert req.data == data
 
+    def test_relative_speed_data(self):
+        for cmd in [TMCC1EngineCommandDef.RELATIVE_SPEED, TMCC2EngineCommandDef.RELATIVE_SPEED]:
+            assert cmd.value.data_offset == 5
+            assert (cmd.value.data_min, cmd.value.data_max) == (-5, 5)
+            for data in range(-5, 6):
+                req = self.build_request(cmd, 1, data)
+                assert req.bits & ~req.command_def.data_mask == RELATIVE_SPEED_MAP[data]
+                assert req.command_def.data_from_bytes(req.as_bytes[1:]) == data
+            with pytest.raises(ValueError, match="not in map"):
+                self.build_request(cmd, 1, 6)
+
     def test_scope(self):
         for cdef in self.all_command_enums:
             for cmd in cdef:
@@ -395,3 +416,11 @@ class TestCommandReq(TestBase):
                     assert req_from_bytes.is_tmcc1 == req.is_tmcc1
                     assert req_from_bytes.is_tmcc2 == req.is_tmcc2
                     assert req_from_bytes.as_bytes == req.as_bytes
+
+    def test_parameter_index_and_data_to_enum(self):
+        # table must agree with a scan of each parameter enum, and be empty for unmapped indexes
+        for index in range(0x10):
+            param_enum = PARAMETER_INDEX_TO_ENUM_MAP.get(index)
+            for data in range(0x100):
+                expected = param_enum.by_value(data) if param_enum else None
+                assert PARAMETER_INDEX_AND_DATA_TO_ENUM[index << 8 | data] is expected
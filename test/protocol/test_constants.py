@@ -56,6 +56,14 @@ class TestConstants(TestBase):
             for en in env:
                 assert env.by_name(en.name) == en
 
+    def test_enum_hash(self) -> None:
+        # int-valued enums must still hash like the ints they compare equal to
+        for env in [TMCC1CommandIdentifier, TMCC2CommandPrefix, TMCC2ParameterIndex]:
+            for en in env:
+                assert hash(en) == hash(en.value)
+                assert {en.value: en}[en] is en
+        assert {CommandScope.ENGINE: 1}[CommandScope.by_name('engine')] == 1
+
     def test_tmcc1_constants(self) -> None:
         """
             All bit patterns are from the Lionel LCS Partner Documentation,
@@ -184,6 +192,38 @@ class TestConstants(TestBase):
         assert TMCC2_ENG_CYLINDER_HISS_SOUND_COMMAND == 0b101010010
         assert TMCC2_ENG_POP_OFF_SOUND_COMMAND == 0b101010011
 
+    def test_tmcc2_command_bits_to_enum(self) -> None:
+        # table must agree with a scan of the enums, in the order the decoder used to check them
+        for value in range(0x200):
+            expected = None
+            for tmcc2_enum in [TMCC2HaltCommandDef, TMCC2EngineCommandDef, TMCC2RouteCommandDef]:
+                expected = tmcc2_enum.by_value(value)
+                if expected is not None:
+                    break
+            assert TMCC2_COMMAND_BITS_TO_ENUM[value] is expected
+        assert TMCC2_COMMAND_BITS_TO_ENUM[TMCC2_RING_BELL_COMMAND] == TMCC2EngineCommandDef.RING_BELL
+        assert TMCC2_COMMAND_BITS_TO_ENUM[TMCC2_SET_ABSOLUTE_SPEED_COMMAND | 99] == TMCC2EngineCommandDef.ABSOLUTE_SPEED
+
+    def test_tmcc2_parameter_bits_unique(self) -> None:
+        # @verify(UNIQUE) compares CommandDef objects, so also check the command bits they carry
+        for param_enum in [TMCC2RailSoundsDialogControl,
+                           TMCC2RailSoundsEffectsControl,
+                           TMCC2EffectsControl,
+                           TMCC2LightingControl]:
+            bits = [m.value.bits for m in param_enum]
+            assert len(bits) == len(set(bits)), f"{param_enum.__name__} reuses command bits"
+        assert TMCC2RailSoundsEffectsControl.COUPLER_STRETCH.value.bits == TMCC2_RS_EFFECTS_FORCE_COUPLER_IMPACT_STRETCH
+
+    def test_tmcc2_scope_to_first_byte(self) -> None:
+        for scope in CommandScope:
+            if scope in TMCC2_SCOPE_TO_FIRST_BYTE_MAP:
+                first_byte = TMCC2_SCOPE_TO_FIRST_BYTE_MAP[scope].to_bytes(1, byteorder='big')
+                assert TMCC2CommandDef.scope_first_byte(scope) == first_byte
+            else:
+                with pytest.raises(ValueError, match="No TMCC2 command prefix"):
+                    TMCC2CommandDef.scope_first_byte(scope)
+        assert TMCC2EngineCommandDef.RING_BELL.value.first_byte == TMCC2CommandPrefix.ENGINE.as_bytes
+
     def test_command_scope_enum(self) -> None:
         # should contain 4 elements
         assert len(CommandScope) == 6
@@ -196,6 +236,11 @@ class TestConstants(TestBase):
         assert TMCC2CommandPrefix.ENGINE == TMCC2CommandPrefix(CommandScope.ENGINE.name)
         assert TMCC2CommandPrefix.TRAIN == TMCC2CommandPrefix(CommandScope.TRAIN.name)
 
+        # names are matched case-insensitively, but only against members
+        assert CommandScope.ROUTE == CommandScope('route')
+        with pytest.raises(ValueError):
+            CommandScope('friendly')
+
     def test_engine_option_enum(self) -> None:
         # should contain no elements
         assert len(CommandDefEnum) == 0
@@ -103,16 +103,13 @@ class MockCommandReq:
                          port: str) -> bytes:
         repeat = Validations.validate_int(repeat, min_value=1, label="repeat")
         delay = Validations.validate_float(delay, min_value=0, label="delay")
-        print(f"In MockCommandRequest._enqueue_command: {cmd.hex()} {repeat}, {delay}, {baudrate}")
 
-        cmd_bytes: bytes = bytes()
-        for _ in range(repeat):
-            cmd_bytes += cmd
-        return cmd_bytes
+        return bytes(cmd) * repeat
 
 
 # noinspection PyMethodMayBeStatic
 class MockCommBuffer:
+    __slots__ = ('baudrate', 'port', '__initialized')
     _instance = None
 
     def __init__(self, baudrate: int, port: str):